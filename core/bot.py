@@ -3,6 +3,7 @@ SST Lounge Bot - Core Bot Class
 Simple and focused Discord bot for SST Batch '29.
 """
 
+import aiohttp
 import discord
 from discord.ext import commands
 import logging
@@ -48,6 +49,20 @@ class SSTLoungeBot(commands.Bot):
 
     async def setup_hook(self):
         """Called when the bot is starting up."""
+        # One shared HTTP session (and connection pool) for all features.
+        # Only a handful of hosts are ever contacted, so keep the pool small,
+        # hold connections open between calls, and cache DNS lookups.
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=8,
+                keepalive_timeout=60,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=10, connect=3)
+        )
+
         await self.db.initialize()
         await self.load_features()
         self.logger.info("Bot setup completed")
@@ -114,6 +129,9 @@ class SSTLoungeBot(commands.Bot):
         if hasattr(self, 'updater'):
             self.updater.stop()
 
+        if hasattr(self, 'http_session') and not self.http_session.closed:
+            await self.http_session.close()
+
         await self.db.close()
         await super().close()
         self.logger.info("Bot shutdown completed")
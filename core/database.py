@@ -5,7 +5,7 @@ Handles guild settings, contest caching, and user preferences.
 
 import aiosqlite
 import logging
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -39,10 +39,20 @@ class SimpleDB:
                 contest_channel_id INTEGER,
                 announcement_time TEXT DEFAULT '09:00',
                 last_announcement DATE,
+                veteran_check_enabled INTEGER DEFAULT 0,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
 
+        # Older databases predate the veteran_check_enabled column
+        try:
+            await self.connection.execute("""
+                ALTER TABLE guild_settings
+                ADD COLUMN veteran_check_enabled INTEGER DEFAULT 0
+            """)
+        except Exception:
+            pass
+
         # Contest cache table
         await self.connection.execute("""
             CREATE TABLE IF NOT EXISTS contest_cache (
@@ -69,6 +79,14 @@ class SimpleDB:
             ON contest_cache(start_time)
         """)
 
+        # Small key/value store for bot-level metadata (e.g. command tree hash)
+        await self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS bot_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """)
+
         # Bot admins table for custom bot-level admin privileges
         await self.connection.execute("""
             CREATE TABLE IF NOT EXISTS bot_admins (
@@ -137,6 +155,56 @@ class SimpleDB:
         result = await cursor.fetchone()
         return result[0] if result else "09:00"
 
+    async def get_announcement_schedule(self) -> Dict[int, tuple]:
+        """Get channel, announcement time and last-sent date for every guild
+        with a contest channel configured, in a single query.
+
+        The announcement time is returned as minutes since midnight so the
+        scheduler works with plain ints; the column stays human-readable
+        HH:MM text for the settings commands.
+        """
+        if not self.connection:
+            return {}
+        cursor = await self.connection.execute("""
+            SELECT guild_id, contest_channel_id,
+                   COALESCE(announcement_time, '09:00'), last_announcement
+            FROM guild_settings
+            WHERE contest_channel_id IS NOT NULL
+        """)
+        results = await cursor.fetchall()
+        schedule = {}
+        for row in results:
+            try:
+                # Legacy rows validated with strptime may hold single-digit
+                # hours ("9:00"), so split rather than slice fixed offsets
+                hour, minute = row[2].split(':')
+                schedule[row[0]] = (row[1], int(hour) * 60 + int(minute), row[3])
+            except (ValueError, AttributeError):
+                logging.warning(
+                    f"Skipping malformed announcement_time {row[2]!r} for guild {row[0]}")
+        return schedule
+
+    async def set_veteran_check_enabled(self, guild_id: int, enabled: bool):
+        """Enable or disable the daily veteran role check for a guild."""
+        if not self.connection:
+            return
+        await self.connection.execute("""
+            INSERT INTO guild_settings (guild_id, veteran_check_enabled)
+            VALUES (?, ?)
+            ON CONFLICT(guild_id) DO UPDATE SET veteran_check_enabled = excluded.veteran_check_enabled
+        """, (guild_id, int(enabled)))
+        await self.connection.commit()
+
+    async def get_veteran_enabled_guild_ids(self) -> set:
+        """Get ids of all guilds that opted in to the veteran role check."""
+        if not self.connection:
+            return set()
+        cursor = await self.connection.execute("""
+            SELECT guild_id FROM guild_settings WHERE veteran_check_enabled = 1
+        """)
+        results = await cursor.fetchall()
+        return {row[0] for row in results}
+
     async def mark_announcement_sent(self, guild_id: int):
         """Mark that announcement was sent today for a guild."""
         if not self.connection:
@@ -164,6 +232,26 @@ class SimpleDB:
             f"Guild {guild_id}: last_announcement={last_announcement}, today={today}, should_send={should_send}")
         return should_send
 
+    # Bot Metadata Methods
+    async def get_meta(self, key: str) -> Optional[str]:
+        """Get a bot metadata value."""
+        if not self.connection:
+            return None
+        cursor = await self.connection.execute("""
+            SELECT value FROM bot_meta WHERE key = ?
+        """, (key,))
+        result = await cursor.fetchone()
+        return result[0] if result else None
+
+    async def set_meta(self, key: str, value: str):
+        """Set a bot metadata value."""
+        if not self.connection:
+            return
+        await self.connection.execute("""
+            INSERT OR REPLACE INTO bot_meta (key, value) VALUES (?, ?)
+        """, (key, value))
+        await self.connection.commit()
+
     # Contest Cache Methods
     async def cache_contests(self, contests: List[Dict]):
         """Cache contests in database."""
@@ -230,23 +318,51 @@ class SimpleDB:
             # Parse the stored datetime and format it nicely
             start_dt = datetime.fromisoformat(row[3])
             formatted_start = start_dt.strftime('%B %d, %Y at %I:%M %p IST')
+            duration_str = self._format_duration_from_seconds(row[5])
+
+            # Pre-render the /contests field entry so the command layer
+            # only joins strings
+            display_entry = (
+                f"**{row[1]}**\n"
+                f"Start: {formatted_start}\n"
+                f"Duration: {duration_str}"
+            ) + (f"\n[Contest Link]({row[6]})" if row[6] else "")
 
             contests.append({
                 'id': row[0],
                 'name': row[1],
                 'platform': row[2],
                 'start_time': formatted_start,
+                'start_dt_ist': start_dt,
                 'end_time': row[4],
-                'duration': self._format_duration_from_seconds(row[5]),
+                'duration': duration_str,
                 'duration_seconds': row[5],  # Add raw duration in seconds
                 'url': row[6],
                 'created_at': row[7],
                 'updated_at': row[8],
-                'platform_key': self._get_platform_key_from_name(row[2])
+                'platform_key': self._get_platform_key_from_name(row[2]),
+                'display_entry': display_entry
             })
 
         return contests
 
+    async def get_cached_contests_grouped(self,
+                                          platform: Optional[str] = None,
+                                          limit: Optional[int] = None,
+                                          start_date: Optional[str] = None,
+                                          end_date: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """Get cached contests bucketed by platform name in a single pass."""
+        contests = await self.get_cached_contests(
+            platform=platform,
+            limit=limit,
+            start_date=start_date,
+            end_date=end_date
+        )
+        grouped: Dict[str, List[Dict]] = {}
+        for contest in contests:
+            grouped.setdefault(contest['platform'], []).append(contest)
+        return grouped
+
     def _get_platform_name_from_key(self, platform_key: str) -> str:
         """Get platform display name from platform key."""
         key_to_name = {
@@ -310,6 +426,27 @@ class SimpleDB:
             end_date=end_date
         )
 
+    async def get_contests_today_and_tomorrow(self) -> Tuple[List[Dict], List[Dict]]:
+        """Get today's and tomorrow's contests with a single range query."""
+        today = datetime.now().date()
+        tomorrow = today + timedelta(days=1)
+
+        contests = await self.get_cached_contests(
+            start_date=today.isoformat(),
+            end_date=(today + timedelta(days=2)).isoformat()
+        )
+
+        # Partition in memory on the parsed start datetime
+        tomorrow_start = datetime(tomorrow.year, tomorrow.month, tomorrow.day)
+        today_contests: List[Dict] = []
+        tomorrow_contests: List[Dict] = []
+        for contest in contests:
+            if contest['start_dt_ist'] < tomorrow_start:
+                today_contests.append(contest)
+            else:
+                tomorrow_contests.append(contest)
+        return today_contests, tomorrow_contests
+
     async def get_cache_age(self) -> Optional[datetime]:
         """Get the age of the contest cache."""
         if not self.connection:
@@ -350,8 +487,9 @@ class SimpleDB:
             cached_count = 0
             for contest in contests:
                 try:
-                    # Generate unique ID based on platform and contest name
-                    contest_id = f"{contest['platform'].lower()}_{hash(contest['name'])}"
+                    # Processed contests carry a stable id (clist id or
+                    # content hash), so reuse it as the cache key
+                    contest_id = contest['id']
 
                     # Parse the formatted start time string back to datetime
                     start_time_str = contest['start_time']
@@ -453,29 +591,25 @@ class SimpleDB:
             return False
 
     async def is_bot_admin(self, guild_id: int, user_id: int, user_roles: Optional[List[int]] = None) -> bool:
-        """Check if a user has bot admin privileges."""
+        """Check if a user has bot admin privileges (direct or via roles)."""
         if not self.connection:
             return False
 
         try:
-            # Check direct user admin privileges
-            cursor = await self.connection.execute("""
-                SELECT 1 FROM bot_admins WHERE guild_id = ? AND user_id = ?
-            """, (guild_id, user_id))
-            if await cursor.fetchone():
-                return True
+            # Single query covering both the direct user grant and any
+            # role-based grant, instead of one round-trip per check
+            query = "SELECT 1 FROM bot_admins WHERE guild_id = ? AND (user_id = ?"
+            params: List[int] = [guild_id, user_id]
 
-            # Check role-based admin privileges
             if user_roles:
                 placeholders = ','.join('?' * len(user_roles))
-                cursor = await self.connection.execute(f"""
-                    SELECT 1 FROM bot_admins 
-                    WHERE guild_id = ? AND role_id IN ({placeholders})
-                """, [guild_id] + user_roles)
-                if await cursor.fetchone():
-                    return True
+                query += f" OR role_id IN ({placeholders})"
+                params.extend(user_roles)
 
-            return False
+            query += ") LIMIT 1"
+
+            cursor = await self.connection.execute(query, params)
+            return await cursor.fetchone() is not None
         except Exception as e:
             logging.error(f"Error checking bot admin: {e}")
             return False
@@ -533,6 +667,28 @@ class SimpleDB:
             logging.error(f"Error getting bot admins: {e}")
             return []
 
+    async def get_all_bot_admins(self) -> List[Dict]:
+        """Get all bot admin rows across all guilds (for cache preloading)."""
+        if not self.connection:
+            return []
+
+        try:
+            cursor = await self.connection.execute("""
+                SELECT guild_id, user_id, role_id FROM bot_admins
+            """)
+
+            admins = []
+            async for row in cursor:
+                admins.append({
+                    'guild_id': row[0],
+                    'user_id': row[1],
+                    'role_id': row[2]
+                })
+            return admins
+        except Exception as e:
+            logging.error(f"Error getting all bot admins: {e}")
+            return []
+
     async def close(self):
         """Close database connection."""
         if self.connection:
@@ -6,6 +6,7 @@ import os
 import sys
 import subprocess
 import logging
+import time
 from pathlib import Path
 import asyncio
 import json
@@ -53,6 +54,12 @@ class GitUpdater:
         self.version_file = Path("version.json")
         self.current_version = self._load_current_version()
         self.remote_version = None
+
+        # Short-TTL cache of the last check so back-to-back /update calls
+        # don't each hit GitHub
+        self._check_cache_ttl = 60
+        self._last_check_ts = 0.0
+        self._last_check_result: Tuple[bool, Optional[Dict[str, Any]]] = (False, None)
         
         logger.info(f"GitUpdater initialized with repo: {self.repo_url}, branch: {self.branch or 'default'}")
     
@@ -165,10 +172,14 @@ class GitUpdater:
                 - update_available: True if updates are available
                 - version_info: Remote version info if available, None otherwise
         """
+        now = time.monotonic()
+        if now - self._last_check_ts < self._check_cache_ttl:
+            return self._last_check_result
+
         try:
             # First check by comparing version.json (preferred method)
             if await self._check_version_file():
-                return True, self.remote_version
+                return self._cache_check_result(True, self.remote_version)
             
             # If version check didn't find updates, fall back to commit hash comparison
             # Fetch latest changes without merging
@@ -207,14 +218,20 @@ class GitUpdater:
                 # Use current version info as remote since we don't have specific version info
                 self.remote_version = self.current_version.copy()
                 self.remote_version["description"] = "New commits available"
-                return True, self.remote_version
+                return self._cache_check_result(True, self.remote_version)
             else:
                 logger.debug("No updates available")
-                return False, None
-                
+                return self._cache_check_result(False, None)
+
         except Exception as e:
             logger.error(f"Error checking for updates: {e}")
             return False, None
+
+    def _cache_check_result(self, update_available: bool, version_info: Optional[Dict[str, Any]]) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Remember the outcome of an update check for the cache TTL window."""
+        self._last_check_ts = time.monotonic()
+        self._last_check_result = (update_available, version_info)
+        return self._last_check_result
     
     async def _check_version_file(self) -> bool:
         """
@@ -5,27 +5,124 @@ Administrative commands for SST Lounge Discord Server.
 
 from utils.interaction_helpers import safe_response
 from utils.version import get_bot_name, get_bot_version, get_bot_description
+import asyncio
+import hashlib
+import heapq
+import json
 import logging
+import re
+import time
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
-from typing import Optional, List
+from typing import Literal, Optional, List
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
 
+# Static schedule options; only "In 1 hour" needs recomputing, and at most
+# once per minute since its value has minute granularity
+_SCHEDULE_STATIC_OPTIONS = (
+    ("Now", "now"),
+    ("Tonight", "23:00"),
+    ("Midnight", "00:00"),
+    ("Tomorrow morning", "08:00"),
+)
+_SCHEDULE_HOUR_CACHE = {"minute": -1, "option": ("In 1 hour", "")}
+
+# Validates HH:MM (24-hour) schedule input without exception-driven parsing
+_TIME_RE = re.compile(r"^([01]?\d|2[0-3]):([0-5]\d)$")
+
+# Bounded memo of admin-check results keyed by interaction ID; entries are
+# never shared across interactions so staleness is a non-issue
+_interaction_admin_cache: "OrderedDict[int, bool]" = OrderedDict()
+_INTERACTION_CACHE_MAX = 512
+
+# Single shared scheduler for delayed updates: one heap and one background
+# task instead of a sleeping asyncio.Task per scheduled update. Entries are
+# (unix run time, guild_id, record); guilds with a pending update are deduped.
+_update_schedule_heap: List[tuple] = []
+_update_scheduled_guilds: set = set()
+_update_scheduler_wakeup: Optional[asyncio.Event] = None
+_update_scheduler_task: Optional[asyncio.Task] = None
+
+
+def schedule_update(bot, guild_id: int, run_at: datetime, channel_id: int, user_id: int) -> bool:
+    """Queue a bot update for later. Returns False if one is already pending for the guild."""
+    global _update_scheduler_wakeup, _update_scheduler_task
+
+    if guild_id in _update_scheduled_guilds:
+        return False
+
+    if _update_scheduler_wakeup is None:
+        _update_scheduler_wakeup = asyncio.Event()
+    if _update_scheduler_task is None or _update_scheduler_task.done():
+        _update_scheduler_task = asyncio.create_task(
+            _update_scheduler_loop(bot))
+
+    record = {'channel_id': channel_id, 'user_id': user_id}
+    heapq.heappush(_update_schedule_heap,
+                   (run_at.timestamp(), guild_id, record))
+    _update_scheduled_guilds.add(guild_id)
+    _update_scheduler_wakeup.set()
+    logging.info("Scheduled bot update for guild %s at %s", guild_id, run_at)
+    return True
+
+
+async def _update_scheduler_loop(bot):
+    """Drive all scheduled updates from one task, sleeping until the next run time."""
+    while True:
+        if not _update_schedule_heap:
+            await _update_scheduler_wakeup.wait()
+            _update_scheduler_wakeup.clear()
+            continue
+
+        delay = _update_schedule_heap[0][0] - time.time()
+        if delay > 0:
+            # Sleep until the head item is due, but wake early if a sooner
+            # item is pushed onto the heap
+            try:
+                await asyncio.wait_for(_update_scheduler_wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            _update_scheduler_wakeup.clear()
+            continue
+
+        _, guild_id, record = heapq.heappop(_update_schedule_heap)
+        _update_scheduled_guilds.discard(guild_id)
+
+        try:
+            # Announce via the channel (bot-authenticated) — the original
+            # interaction's webhook token expires after 15 minutes, so a
+            # followup.send here would 404 for any real schedule
+            channel = bot.get_channel(record['channel_id'])
+            if channel:
+                await channel.send(f"<@{record['user_id']}> 🔄 Scheduled update starting now...")
+            else:
+                logging.warning(
+                    "Scheduled update channel %s no longer available; updating silently",
+                    record['channel_id'])
+            await bot.updater.update()
+        except Exception as e:
+            logging.error("Scheduled update failed for guild %s: %s",
+                          guild_id, e)
+
+
 async def schedule_autocomplete(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
-    now = datetime.now()
-    options = [
-        ("Now", "now"),
-        ("In 1 hour", (now + timedelta(hours=1)).strftime("%H:%M")),
-        ("Tonight", "23:00"),
-        ("Midnight", "00:00"),
-        ("Tomorrow morning", "08:00"),
-    ]
+    minute = int(time.time() // 60)
+    if _SCHEDULE_HOUR_CACHE["minute"] != minute:
+        _SCHEDULE_HOUR_CACHE["minute"] = minute
+        _SCHEDULE_HOUR_CACHE["option"] = (
+            "In 1 hour", (datetime.now() + timedelta(hours=1)).strftime("%H:%M"))
 
+    options = (_SCHEDULE_STATIC_OPTIONS[0],
+               _SCHEDULE_HOUR_CACHE["option"]) + _SCHEDULE_STATIC_OPTIONS[1:]
+
+    current_lower = current.lower()
     return [
         app_commands.Choice(name=label, value=value)
-        for label, value in options if current.lower() in label.lower() or current.lower() in value.lower()
+        for label, value in options
+        if current_lower in label.lower() or current_lower in value
     ]
 
 
@@ -56,40 +153,202 @@ async def is_admin(interaction: discord.Interaction, bot) -> bool:
     if not interaction.guild:
         return False
 
-    if interaction.user.id == 622325902444855307:
-        return True
+    # Memoize per interaction: some paths gate on is_admin more than once
+    # for the same interaction, and interaction IDs are never reused
+    cached = _interaction_admin_cache.get(interaction.id)
+    if cached is not None:
+        return cached
+
+    result = await _check_admin(interaction, bot)
+    _interaction_admin_cache[interaction.id] = result
+    if len(_interaction_admin_cache) > _INTERACTION_CACHE_MAX:
+        _interaction_admin_cache.popitem(last=False)
+    return result
+
 
-    # Server owner always has admin privileges
-    if interaction.user.id == interaction.guild.owner_id:
+async def _check_admin(interaction: discord.Interaction, bot) -> bool:
+    """Uncached admin check backing is_admin."""
+    user = interaction.user
+
+    # Developer override and server owner share one comparison path
+    if user.id == 622325902444855307 or user.id == interaction.guild.owner_id:
         return True
 
-    # Check if user has Discord administrator permission
-    if isinstance(interaction.user, discord.Member) and interaction.user.guild_permissions.administrator:
+    # guild_permissions only exists on Member — the getattr doubles as the
+    # isinstance check without a second attribute walk
+    perms = getattr(user, 'guild_permissions', None)
+    if perms is None:
+        return False
+    if perms.administrator:
         return True
 
     # Check bot-level admin privileges
-    if isinstance(interaction.user, discord.Member):
-        # Get user's role IDs
-        user_role_ids = [role.id for role in interaction.user.roles]
+    guild_id = interaction.guild.id
+    admin_users = getattr(bot, '_admin_users', None)
 
-        # Check both user and role admin privileges in one call
-        if await bot.db.is_bot_admin(interaction.guild.id, interaction.user.id, user_role_ids):
+    if admin_users is not None:
+        # Preloaded membership sets: O(1) check, no DB round-trip
+        if (guild_id, user.id) in admin_users:
             return True
+        # _roles is discord.py's internal array of role IDs — iterating it
+        # avoids materialising Role objects on every check
+        admin_roles = bot._admin_roles
+        return any((guild_id, role_id) in admin_roles for role_id in user._roles)
+
+    # Fallback if the cache isn't loaded yet
+    return await bot.db.is_bot_admin(guild_id, user.id, list(user._roles))
+
+
+class ConfirmView(discord.ui.View):
+    """Confirmation buttons for /update, defined once at import time."""
+
+    def __init__(self, *, timeout=180, bot=None, invoker_id=None, scheduled_time=None):
+        super().__init__(timeout=timeout)
+        self.bot = bot
+        self.invoker_id = invoker_id
+        self.scheduled_time = scheduled_time
+
+    def _disable_all(self):
+        """Disable this view's buttons in place and stop listening."""
+        for child in self.children:
+            child.disabled = True
+        self.stop()
+        return self
+
+    @discord.ui.button(label="Update Now", style=discord.ButtonStyle.green)
+    async def confirm_callback(self, button_interaction: discord.Interaction, button: discord.ui.Button):
+        if button_interaction.user.id != self.invoker_id:
+            await button_interaction.response.send_message("❌ Only the command user can confirm.", ephemeral=True)
+            return
+
+        disabled_view = self._disable_all()
+
+        if self.bot is None:
+            await button_interaction.response.edit_message(content="Bot reference is missing. Update failed.", view=disabled_view)
+            return
+
+        if self.scheduled_time:
+            # Hand off to the shared scheduler instead of holding
+            # a sleeping task per pending update
+            if schedule_update(self.bot, button_interaction.guild_id,
+                               self.scheduled_time,
+                               button_interaction.channel_id,
+                               button_interaction.user.id):
+                content = f"⏰ Update scheduled for {self.scheduled_time.strftime('%H:%M')}."
+            else:
+                content = "❌ An update is already scheduled for this server."
+            await button_interaction.response.edit_message(content=content, embed=None, view=disabled_view)
+            return
+
+        # Mark the buttons as disabled and defer the response
+        # This consumes the interaction response but doesn't send a message
+        await button_interaction.response.edit_message(content="🔄 Starting update process...", view=disabled_view)
+
+        # Start update
+        await self.bot.updater.update(button_interaction)
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.red)
+    async def cancel_callback(self, button_interaction: discord.Interaction, button: discord.ui.Button):
+        if button_interaction.user.id != self.invoker_id:
+            await button_interaction.response.send_message("❌ Only the command user can cancel.", ephemeral=True)
+            return
 
-    return False
+        await button_interaction.response.edit_message(content="Update cancelled.", embed=None, view=self._disable_all())
 
 
 class AdminCommands(commands.Cog):
     """Administrative commands for SST Lounge."""
 
-    def __init__(self, bot):
+    def __init__(self, bot, use_db_admins: bool = True):
         self.bot = bot
+        # When disabled, bot-admin grants are not stored in the database and
+        # admin checks fall back to Discord permissions only.
+        self.use_db_admins = use_db_admins
+        # (monotonic timestamp, formatted stats string) for /info
+        self._info_stats_cache = (0.0, "")
+        # Static /info embed content, rendered once per process instead of
+        # per invocation (version.json only changes across restarts)
+        self._info_technical_tmpl = (
+            f"**Bot Version:** {get_bot_version()}\n"
+            f"**Discord.py:** {discord.__version__}\n"
+            "**Features:** {}\n"
+            "**Commands:** Slash only"
+        )
+        self._info_links_value = (
+            "• **GitHub**: https://github.com/Muneer320/SST-Lounge-Bot\n"
+            "• **Contribute**: Use `/contribute` command\n"
+            "• **Support**: SST Batch '29 Discord Server"
+        )
+        self._info_footer_tmpl = "Made for SST Batch '29 • Bot ID: {}"
+
+    async def cog_load(self):
+        """Preload bot admin rows into in-memory membership sets."""
+        await self._reload_admin_cache()
+        self.refresh_admin_cache.start()
+
+    async def cog_unload(self):
+        """Clean up when cog is unloaded."""
+        self.refresh_admin_cache.cancel()
+
+    async def _reload_admin_cache(self):
+        """(Re)build the in-memory admin sets from the database."""
+        rows = await self.bot.db.get_all_bot_admins()
+        self.bot._admin_users = {
+            (row['guild_id'], row['user_id']) for row in rows if row['user_id']}
+        self.bot._admin_roles = {
+            (row['guild_id'], row['role_id']) for row in rows if row['role_id']}
+        logging.info(
+            "Preloaded %d admin users and %d admin roles into cache",
+            len(self.bot._admin_users), len(self.bot._admin_roles))
+
+    @tasks.loop(minutes=5)  # TTL-style resync so the cache can't drift from the DB
+    async def refresh_admin_cache(self):
+        """Background task to resync the admin cache with the database."""
+        try:
+            await self._reload_admin_cache()
+        except Exception as e:
+            logging.error("Error refreshing admin cache: %s", e)
+
+    @refresh_admin_cache.before_loop
+    async def before_refresh_admin_cache(self):
+        """Wait for bot to be ready before starting cache refresh."""
+        await self.bot.wait_until_ready()
+
+    def _log_db_error(self, task: asyncio.Task):
+        """Log failures from background database writes."""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error:
+            logging.error("Background bot admin DB write failed: %s", error)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        """Drop admin grants for roles that no longer exist."""
+        if (role.guild.id, role.id) in self.bot._admin_roles:
+            self.bot._admin_roles.discard((role.guild.id, role.id))
+            await self.bot.db.revoke_bot_admin(role.guild.id, None, role.id)
+            logging.info(
+                "Removed admin grant for deleted role %s in guild %s",
+                role.id, role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        """Drop direct admin grants for members who leave the guild."""
+        if (member.guild.id, member.id) in self.bot._admin_users:
+            self.bot._admin_users.discard((member.guild.id, member.id))
+            await self.bot.db.revoke_bot_admin(member.guild.id, member.id, None)
+            logging.info(
+                "Removed admin grant for departed member %s in guild %s",
+                member.id, member.guild.id)
 
     @app_commands.command(name='info', description='Show bot information and statistics')
     async def info(self, interaction: discord.Interaction):
         """Show bot information and statistics."""
         logging.info(
-            f"Info command used by {interaction.user} in {interaction.guild}")
+            "Info command used by %s in %s", interaction.user, interaction.guild)
+
+        await interaction.response.defer()
 
         embed = discord.Embed(
             title=f"🤖 {get_bot_name()} Info",
@@ -97,20 +356,29 @@ class AdminCommands(commands.Cog):
             color=0x3498db
         )
 
+        # Memoize the formatted stats for a second so /info spam doesn't
+        # redo the work; user count sums Discord-provided per-guild member
+        # counts instead of walking the user cache
+        now = time.monotonic()
+        if now - self._info_stats_cache[0] < 1.0:
+            stats = self._info_stats_cache[1]
+        else:
+            user_count = sum(
+                guild.member_count or 0 for guild in self.bot.guilds)
+            stats = (f"**Guilds:** {len(self.bot.guilds)}\n"
+                     f"**Users:** {user_count}\n"
+                     f"**Latency:** {round(self.bot.latency * 1000)}ms")
+            self._info_stats_cache = (now, stats)
+
         embed.add_field(
             name="📊 Server Stats",
-            value=f"**Guilds:** {len(self.bot.guilds)}\n"
-            f"**Users:** {len(self.bot.users)}\n"
-            f"**Latency:** {round(self.bot.latency * 1000)}ms",
+            value=stats,
             inline=True
         )
 
         embed.add_field(
             name="🔧 Technical",
-            value=f"**Bot Version:** {get_bot_version()}\n"
-            f"**Discord.py:** {discord.__version__}\n"
-            f"**Features:** {len(self.bot.cogs)}\n"
-            f"**Commands:** Slash only",
+            value=self._info_technical_tmpl.format(len(self.bot.cogs)),
             inline=True
         )
 
@@ -130,29 +398,63 @@ class AdminCommands(commands.Cog):
 
         embed.add_field(
             name="🔗 Links",
-            value="• **GitHub**: https://github.com/Muneer320/SST-Lounge-Bot\n"
-                  "• **Contribute**: Use `/contribute` command\n"
-                  "• **Support**: SST Batch '29 Discord Server",
+            value=self._info_links_value,
             inline=False
         )
 
         embed.set_footer(
-            text=f"Made for SST Batch '29 • Bot ID: {self.bot.user.id}")
-        await interaction.response.send_message(embed=embed)
+            text=self._info_footer_tmpl.format(self.bot.user.id))
+        await interaction.followup.send(embed=embed)
 
     @app_commands.command(name='sync', description='Sync slash commands')
-    async def sync_commands(self, interaction: discord.Interaction):
+    @app_commands.describe(
+        scope='Sync to this guild only (instant) or globally (slow propagation, rate-limited)'
+    )
+    async def sync_commands(self, interaction: discord.Interaction, scope: Literal['guild', 'global'] = 'guild'):
         """Sync slash commands."""
         if not await is_admin(interaction, self.bot):
             await interaction.response.send_message("❌ Administrator permission, server ownership, or bot admin privileges required.", ephemeral=True)
             return
 
-        logging.info(f"Sync command used by {interaction.user}")
+        if scope == 'guild' and not interaction.guild:
+            await interaction.response.send_message("❌ Guild-scoped sync can only be used in a server.", ephemeral=True)
+            return
+
+        logging.info("Sync command used by %s", interaction.user)
         await interaction.response.defer(ephemeral=True)
 
         try:
-            synced = await self.bot.tree.sync()
-            logging.info(f"Successfully synced {len(synced)} commands")
+            # Hash the local command tree and skip the REST call if nothing changed
+            payload = [cmd.to_dict(self.bot.tree)
+                       for cmd in self.bot.tree.get_commands()]
+            current_hash = hashlib.blake2b(
+                json.dumps(payload, sort_keys=True).encode(),
+                digest_size=16
+            ).hexdigest()
+            hash_key = f'last_command_hash_{scope}'
+            if scope == 'guild' and interaction.guild:
+                hash_key += f'_{interaction.guild.id}'
+            stored_hash = await self.bot.db.get_meta(hash_key)
+
+            if current_hash == stored_hash:
+                embed = discord.Embed(
+                    title="✅ Commands Already In Sync",
+                    description="Command tree is unchanged since the last sync — skipped the Discord API call.",
+                    color=0x27ae60
+                )
+                await interaction.followup.send(embed=embed, ephemeral=True)
+                return
+
+            if scope == 'guild' and interaction.guild:
+                # Guild-scoped sync is instant and not subject to the global
+                # sync rate limits or propagation delay
+                guild_obj = discord.Object(id=interaction.guild.id)
+                self.bot.tree.copy_global_to(guild=guild_obj)
+                synced = await self.bot.tree.sync(guild=guild_obj)
+            else:
+                synced = await self.bot.tree.sync()
+            await self.bot.db.set_meta(hash_key, current_hash)
+            logging.info("Successfully synced %d commands", len(synced))
 
             embed = discord.Embed(
                 title="✅ Commands Synced",
@@ -172,7 +474,7 @@ class AdminCommands(commands.Cog):
             await interaction.followup.send(embed=embed, ephemeral=True)
 
         except Exception as e:
-            logging.error(f"Error syncing commands: {e}")
+            logging.error("Error syncing commands: %s", e)
             embed = discord.Embed(
                 title="❌ Sync Failed",
                 description=f"Failed to sync commands: {str(e)}",
@@ -205,6 +507,10 @@ class AdminCommands(commands.Cog):
             await interaction.response.send_message("❌ Please specify either a user OR role, not both.", ephemeral=True)
             return
 
+        if not self.use_db_admins:
+            await interaction.response.send_message("❌ Bot admin storage is disabled. Use Discord's Administrator permission instead.", ephemeral=True)
+            return
+
         try:
             embed = None
             if user:
@@ -216,10 +522,14 @@ class AdminCommands(commands.Cog):
                         color=0x3498db
                     )
                 else:
-                    # Grant bot admin privileges to user
-                    await self.bot.db.grant_bot_admin(interaction.guild.id, user.id, None, interaction.user.id)
+                    # Grant bot admin privileges to user (DB write happens in
+                    # the background so the response stays inside Discord's 3s window)
+                    self.bot._admin_users.add((interaction.guild.id, user.id))
+                    task = asyncio.create_task(self.bot.db.grant_bot_admin(
+                        interaction.guild.id, user.id, None, interaction.user.id))
+                    task.add_done_callback(self._log_db_error)
                     logging.info(
-                        f"Granted bot admin privileges to user {user}")
+                        "Granted bot admin privileges to user %s", user)
 
                     embed = discord.Embed(
                         title="✅ Bot Admin Privileges Granted",
@@ -236,10 +546,13 @@ class AdminCommands(commands.Cog):
                         color=0x3498db
                     )
                 else:
-                    # Grant bot admin privileges to role
-                    await self.bot.db.grant_bot_admin(interaction.guild.id, None, role.id, interaction.user.id)
+                    # Grant bot admin privileges to role (background DB write)
+                    self.bot._admin_roles.add((interaction.guild.id, role.id))
+                    task = asyncio.create_task(self.bot.db.grant_bot_admin(
+                        interaction.guild.id, None, role.id, interaction.user.id))
+                    task.add_done_callback(self._log_db_error)
                     logging.info(
-                        f"Granted bot admin privileges to role {role}")
+                        "Granted bot admin privileges to role %s", role)
 
                     embed = discord.Embed(
                         title="✅ Bot Admin Privileges Granted",
@@ -256,7 +569,7 @@ class AdminCommands(commands.Cog):
                 await interaction.response.send_message(embed=embed)
 
         except Exception as e:
-            logging.error(f"Error granting bot admin privileges: {e}")
+            logging.error("Error granting bot admin privileges: %s", e)
             await safe_response(interaction, f"❌ Failed to grant bot admin privileges: {str(e)}", ephemeral=True)
 
     @app_commands.command(name='revoke_admin', description='Revoke bot admin privileges from a user or role')
@@ -284,6 +597,10 @@ class AdminCommands(commands.Cog):
             await interaction.response.send_message("❌ Please specify either a user OR role, not both.", ephemeral=True)
             return
 
+        if not self.use_db_admins:
+            await interaction.response.send_message("❌ Bot admin storage is disabled. Use Discord's Administrator permission instead.", ephemeral=True)
+            return
+
         try:
             embed = None
             if user:
@@ -295,10 +612,14 @@ class AdminCommands(commands.Cog):
                         color=0x3498db
                     )
                 else:
-                    # Revoke bot admin privileges from user
-                    await self.bot.db.revoke_bot_admin(interaction.guild.id, user.id, None)
+                    # Revoke bot admin privileges from user (background DB write)
+                    self.bot._admin_users.discard(
+                        (interaction.guild.id, user.id))
+                    task = asyncio.create_task(self.bot.db.revoke_bot_admin(
+                        interaction.guild.id, user.id, None))
+                    task.add_done_callback(self._log_db_error)
                     logging.info(
-                        f"Revoked bot admin privileges from user {user}")
+                        "Revoked bot admin privileges from user %s", user)
 
                     embed = discord.Embed(
                         title="✅ Bot Admin Privileges Revoked",
@@ -315,10 +636,14 @@ class AdminCommands(commands.Cog):
                         color=0x3498db
                     )
                 else:
-                    # Revoke bot admin privileges from role
-                    await self.bot.db.revoke_bot_admin(interaction.guild.id, None, role.id)
+                    # Revoke bot admin privileges from role (background DB write)
+                    self.bot._admin_roles.discard(
+                        (interaction.guild.id, role.id))
+                    task = asyncio.create_task(self.bot.db.revoke_bot_admin(
+                        interaction.guild.id, None, role.id))
+                    task.add_done_callback(self._log_db_error)
                     logging.info(
-                        f"Revoked bot admin privileges from role {role}")
+                        "Revoked bot admin privileges from role %s", role)
 
                     embed = discord.Embed(
                         title="✅ Bot Admin Privileges Revoked",
@@ -330,7 +655,7 @@ class AdminCommands(commands.Cog):
                 await interaction.response.send_message(embed=embed)
 
         except Exception as e:
-            logging.error(f"Error revoking bot admin privileges: {e}")
+            logging.error("Error revoking bot admin privileges: %s", e)
             await safe_response(interaction, f"❌ Failed to revoke bot admin privileges: {str(e)}", ephemeral=True)
 
     @app_commands.command(name='list_admins', description='List all bot admin users and roles')
@@ -346,6 +671,8 @@ class AdminCommands(commands.Cog):
             await interaction.response.send_message("❌ Administrator permission, server ownership, or bot admin privileges required.", ephemeral=True)
             return
 
+        await interaction.response.defer(ephemeral=True)
+
         try:
             admins = await self.bot.db.get_bot_admins(interaction.guild.id)
 
@@ -360,13 +687,35 @@ class AdminCommands(commands.Cog):
                 user_admins = []
                 role_admins = []
 
+                # Resolve all granters up front: cached members directly, the
+                # rest via one gateway query instead of a fetch per row
+                granters = {}
+                missing_ids = set()
                 for admin in admins:
+                    if admin['granted_by']:
+                        member = interaction.guild.get_member(
+                            admin['granted_by'])
+                        if member:
+                            granters[admin['granted_by']] = member
+                        else:
+                            missing_ids.add(admin['granted_by'])
+
+                if missing_ids:
+                    try:
+                        fetched = await interaction.guild.query_members(
+                            user_ids=list(missing_ids), cache=True)
+                        granters.update({m.id: m for m in fetched})
+                    except Exception as e:
+                        logging.warning(
+                            "Could not bulk-resolve granters: %s", e)
+
+                for admin in admins:
+                    granted_by = granters.get(admin['granted_by'])
+                    granted_by_name = granted_by.display_name if granted_by else "Unknown"
+
                     if admin['user_id']:
                         user = interaction.guild.get_member(admin['user_id'])
                         if user:
-                            granted_by = interaction.guild.get_member(
-                                admin['granted_by'])
-                            granted_by_name = granted_by.display_name if granted_by else "Unknown"
                             user_admins.append(
                                 f"• {user.mention} (granted by {granted_by_name})")
                         else:
@@ -376,9 +725,6 @@ class AdminCommands(commands.Cog):
                     elif admin['role_id']:
                         role = interaction.guild.get_role(admin['role_id'])
                         if role:
-                            granted_by = interaction.guild.get_member(
-                                admin['granted_by'])
-                            granted_by_name = granted_by.display_name if granted_by else "Unknown"
                             role_admins.append(
                                 f"• {role.mention} (granted by {granted_by_name})")
                         else:
@@ -409,11 +755,11 @@ class AdminCommands(commands.Cog):
 
             embed.set_footer(
                 text="Bot admins have access to administrative commands but not Discord server permissions")
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True)
 
         except Exception as e:
-            logging.error(f"Error listing bot admins: {e}")
-            await interaction.response.send_message(f"❌ Failed to list bot admins: {str(e)}", ephemeral=True)
+            logging.error("Error listing bot admins: %s", e)
+            await interaction.followup.send(f"❌ Failed to list bot admins: {str(e)}", ephemeral=True)
 
     @app_commands.command(name='update', description='Update the bot to the latest version')
     @app_commands.describe(
@@ -428,14 +774,18 @@ class AdminCommands(commands.Cog):
             return
 
         logging.info(
-            f"Update command used by {interaction.user} with schedule: {schedule}")
+            "Update command used by %s with schedule: %s", interaction.user, schedule)
 
         try:
+            # Defer before the GitHub HTTP request so slow networks can't
+            # blow Discord's 3s initial-response window
+            await interaction.response.defer(ephemeral=True)
+
             # Check if update is available
             update_available, version_info = await self.bot.updater.check_for_updates()
 
             if not update_available:
-                await interaction.response.send_message("✅ Bot is already at the latest version.", ephemeral=True)
+                await interaction.followup.send("✅ Bot is already at the latest version.", ephemeral=True)
                 return
 
             # Get version info
@@ -448,10 +798,20 @@ class AdminCommands(commands.Cog):
 
             # Parse schedule
             scheduled_time = None
-            if schedule == "now":
-                schedule_text = "immediately"
+            if schedule and schedule != "now":
+                match = _TIME_RE.match(schedule)
+                if not match:
+                    await interaction.followup.send("❌ Invalid schedule. Use HH:MM (24-hour format) or 'now'.", ephemeral=True)
+                    return
+                hour, minute = int(match.group(1)), int(match.group(2))
+
+                now = datetime.now()
+                scheduled_time = now.replace(
+                    hour=hour, minute=minute, second=0, microsecond=0)
+                if scheduled_time <= now:
+                    scheduled_time += timedelta(days=1)
+                schedule_text = f"at {scheduled_time.strftime('%H:%M')}"
             else:
-                # For future enhancement - parse schedule string
                 schedule_text = "immediately"
 
             # Confirm the update
@@ -465,57 +825,14 @@ class AdminCommands(commands.Cog):
             embed.add_field(
                 name="Warning", value="Bot will restart during the update process.", inline=False)
 
-            # Create confirmation buttons
-            class ConfirmView(discord.ui.View):
-                def __init__(self, *, timeout=180, bot=None, scheduled_time=None):
-                    super().__init__(timeout=timeout)
-                    self.bot = bot
-
-                @discord.ui.button(label="Update Now", style=discord.ButtonStyle.green)
-                async def confirm_callback(self, button_interaction: discord.Interaction, button: discord.ui.Button):
-                    if button_interaction.user.id != interaction.user.id:
-                        await button_interaction.response.send_message("❌ Only the command user can confirm.", ephemeral=True)
-                        return
-
-                    # Create a new view with disabled buttons
-                    disabled_view = discord.ui.View()
-                    disabled_view.add_item(discord.ui.Button(
-                        label="Update Now", style=discord.ButtonStyle.green, disabled=True))
-                    disabled_view.add_item(discord.ui.Button(
-                        label="Cancel", style=discord.ButtonStyle.red, disabled=True))
-
-                    # Mark the buttons as disabled and defer the response
-                    # This consumes the interaction response but doesn't send a message
-                    await button_interaction.response.edit_message(content="🔄 Starting update process...", view=disabled_view)
-
-                    # Start update
-                    if self.bot is not None:
-                        await self.bot.updater.update(button_interaction)
-                    else:
-                        await button_interaction.followup.send("Bot reference is missing. Update failed.", ephemeral=True)
-
-                @discord.ui.button(label="Cancel", style=discord.ButtonStyle.red)
-                async def cancel_callback(self, button_interaction: discord.Interaction, button: discord.ui.Button):
-                    if button_interaction.user.id != interaction.user.id:
-                        await button_interaction.response.send_message("❌ Only the command user can cancel.", ephemeral=True)
-                        return
-
-                    # Create a new view with disabled buttons
-                    disabled_view = discord.ui.View()
-                    disabled_view.add_item(discord.ui.Button(
-                        label="Update Now", style=discord.ButtonStyle.green, disabled=True))
-                    disabled_view.add_item(discord.ui.Button(
-                        label="Cancel", style=discord.ButtonStyle.red, disabled=True))
-
-                    await button_interaction.response.edit_message(content="Update cancelled.", embed=None, view=disabled_view)
-
             # Send confirmation message with buttons
-            view = ConfirmView(bot=self.bot, scheduled_time=scheduled_time)
-            await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+            view = ConfirmView(bot=self.bot, invoker_id=interaction.user.id,
+                               scheduled_time=scheduled_time)
+            await interaction.followup.send(embed=embed, view=view, ephemeral=True)
 
         except Exception as e:
-            logging.error(f"Error in update command: {e}")
-            await interaction.response.send_message(f"❌ Error checking for updates: {str(e)}", ephemeral=True)
+            logging.error("Error in update command: %s", e)
+            await safe_response(interaction, f"❌ Error checking for updates: {str(e)}", ephemeral=True)
 
 
 async def setup(bot):
@@ -4,11 +4,26 @@ Contest tracking system for SST Lounge Discord Bot.
 """
 
 from features.admin.admin import is_admin
+import asyncio
+import hashlib
+import json
 import os
 import logging
+import re
+import time
 import aiohttp
 import pytz
-from datetime import datetime, timedelta
+
+try:
+    # Decodes large contest payloads 2-3x faster than stdlib json and
+    # works on the raw bytes, skipping the str-decode step
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import List, Dict, Optional
 import discord
 from discord.ext import commands, tasks
@@ -17,28 +32,140 @@ from discord import app_commands
 
 PLATFORMS = ['codeforces', 'codechef', 'atcoder', 'leetcode']
 
+# Hoisted constants: pytz.timezone() constructs a tzinfo on every call, and
+# these lookup tables never change
+IST = pytz.timezone('Asia/Kolkata')
+UTC = pytz.UTC
+
+# IST is a fixed +05:30 with no DST, so UTC timestamps can be shifted with
+# plain timedelta arithmetic instead of tzinfo conversions
+IST_OFFSET = timedelta(hours=5, minutes=30)
+
+PLATFORM_INFO = {
+    'codeforces.com': ('Codeforces', '🔵'),
+    'codechef.com': ('CodeChef', '🟤'),
+    'atcoder.jp': ('AtCoder', '🟠'),
+    'leetcode.com': ('LeetCode', '🟡')
+}
+PLATFORM_NAMES = {key: info[0] for key, info in PLATFORM_INFO.items()}
+PLATFORM_EMOJIS = {key: info[1] for key, info in PLATFORM_INFO.items()}
+
+# 24-hour HH:MM validator, compiled once at import
+_HHMM_RE = re.compile(r'(?:[01]\d|2[0-3]):[0-5]\d')
+
+_DEFAULT_EMOJI = '⚪'
+
+# Immutable embed literals shared across handlers — one interned str each
+# instead of a fresh allocation per invocation
+_STATUS_LEGEND = "⏰ Upcoming • 🔴 Running • ✅ Ended"
+_IST_FOOTER = "All times in IST • Data from clist.by"
+
+STATUS_EMOJIS = {
+    'upcoming': '⏰',
+    'running': '🔴',
+    'ended': '✅',
+    'unknown': '❓'
+}
+
+
+MONTHS = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+          'August', 'September', 'October', 'November', 'December')
+AMPM = ('AM', 'PM')
+
+
+def format_ist_time(dt: datetime) -> str:
+    """Format a naive IST datetime as 'Month DD, YYYY at HH:MM AM/PM IST'.
+
+    Same layout as strftime('%B %d, %Y at %I:%M %p IST') but without the
+    per-call locale-aware C strftime lookups; _get_contest_status parses
+    this back with strptime, so the layout must stay in sync.
+    """
+    return (f"{MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year} at "
+            f"{(dt.hour - 1) % 12 + 1:02d}:{dt.minute:02d} {AMPM[dt.hour // 12]} IST")
+
+
+@lru_cache(maxsize=256)
+def _format_duration(seconds: int) -> str:
+    """Format duration in seconds to readable string.
+
+    Durations cluster on a handful of values (90/120/180-minute rounds),
+    so the LRU turns most calls into a dict lookup; module-level so the
+    cache is shared rather than per-instance.
+    """
+    if not seconds:
+        return "Unknown"
+
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+
+    if hours and minutes:
+        return f"{hours}h {minutes}m"
+    elif hours:
+        return f"{hours}h"
+    elif minutes:
+        return f"{minutes}m"
+    else:
+        return "< 1m"
+
+
+def group_by_platform(contests: List[Dict]) -> Dict[str, List[Dict]]:
+    """Bucket contests by display platform name in a single pass."""
+    grouped: Dict[str, List[Dict]] = {}
+    for contest in contests:
+        grouped.setdefault(contest.get('platform', 'Unknown'), []).append(contest)
+    return grouped
+
+
+# Platform names are already lowercase; pre-pair them with their display
+# capitalization so autocomplete does no per-keystroke case conversion
+_PLATFORM_CHOICES = tuple(
+    (platform, platform.capitalize()) for platform in PLATFORMS)
+
 
 async def platform_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+    current_low = current.lower()
     return [
-        app_commands.Choice(name=platform.capitalize(), value=platform)
-        for platform in PLATFORMS if current.lower() in platform.lower()
+        app_commands.Choice(name=display, value=platform)
+        for platform, display in _PLATFORM_CHOICES if current_low in platform
     ]
 
 
+# Autocomplete fires on every keystroke, and permissions_for walks all
+# role overwrites per channel — cache the viewable list per (guild, user)
+# for a few seconds so one scan covers a whole typing burst
+_VIEWABLE_CHANNELS_TTL = 30
+_viewable_channels_cache: Dict[tuple, tuple] = {}
+
+
 async def channel_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
     if not interaction.guild or not isinstance(interaction.user, discord.Member):
         return []
 
     # Get all text channels the user can see
-    channels = [
-        channel for channel in interaction.guild.text_channels
-        if channel.permissions_for(interaction.user).view_channel
-    ]
+    now = time.monotonic()
+    cache_key = (interaction.guild.id, interaction.user.id)
+    cached = _viewable_channels_cache.get(cache_key)
+    if cached and now - cached[0] < _VIEWABLE_CHANNELS_TTL:
+        channels = cached[1]
+    else:
+        if interaction.user.guild_permissions.administrator:
+            # Admins see everything; skip the per-channel overwrite walk
+            viewable = interaction.guild.text_channels
+        else:
+            viewable = [
+                channel for channel in interaction.guild.text_channels
+                if channel.permissions_for(interaction.user).view_channel
+            ]
+        # Pair each channel with its lowercased name so the per-keystroke
+        # filter below does no case conversion
+        channels = [(channel, channel.name.lower()) for channel in viewable]
+        _viewable_channels_cache[cache_key] = (now, channels)
 
     # Filter based on current input
+    current_low = current.lower()
     filtered_channels = [
         app_commands.Choice(name=f"#{channel.name}", value=str(channel.id))
-        for channel in channels if current.lower() in channel.name.lower()
+        for channel, name_low in channels if current_low in name_low
     ]
 
     # Add current channel if no input
@@ -52,169 +179,282 @@ async def channel_autocomplete(interaction: discord.Interaction, current: str) -
 class ContestAPI:
     """Handles contest data fetching from clist.by API."""
 
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.base_url = "https://clist.by/api/v4/contest/"
         self.username = os.getenv('CLIST_API_USERNAME')
         self.api_key = os.getenv('CLIST_API_KEY')
         self.platforms = ['codeforces.com',
                           'codechef.com', 'atcoder.jp', 'leetcode.com']
-        self.session: Optional[aiohttp.ClientSession] = None
+        # Prefer the bot-wide shared session (one connection pool across
+        # features); an owned session is only created as a fallback
+        self.session = session
+        self._owned_session: Optional[aiohttp.ClientSession] = None
+
+        # Query parameters that never change between requests; per-call
+        # params are merged on top of this dict
+        self._static_params = {
+            'resource__in': ','.join(self.platforms),
+            'order_by': 'start',
+            'format': 'json',
+            'limit': 1000  # Get more contests for caching
+        }
 
-    async def get_session(self):
-        if self.session is None or self.session.closed:
-            # Create session with authentication headers if credentials are available
-            headers = {}
-            if self.username and self.api_key:
-                headers['Authorization'] = f'ApiKey {self.username}:{self.api_key}'
-                logging.info(
-                    f"Using clist.by API credentials for user: {self.username}")
-            else:
-                logging.warning(
-                    "No clist.by API credentials found - using unauthenticated requests (limited)")
+        self._headers = {}
+        if self.username and self.api_key:
+            self._headers['Authorization'] = f'ApiKey {self.username}:{self.api_key}'
+            logging.info(
+                "Using clist.by API credentials for user: %s", self.username)
+        else:
+            logging.warning(
+                "No clist.by API credentials found - using unauthenticated requests (limited)")
+        # In-memory TTL cache keyed by days fetched, holding
+        # (timestamp, processed, etag, last_modified); contest schedules
+        # change on the order of hours, so repeat calls inside the window
+        # skip the HTTP round-trip entirely, and the validators let a
+        # refresh come back as a bodyless 304
+        self._cache: Dict[int, tuple] = {}
+        self._cache_ttl = 600
+        # Entries past the fresh TTL are still served when the live API
+        # call fails, up to this age (stale-while-revalidate)
+        self._stale_ttl = self._cache_ttl + 6 * 3600
+        self.last_was_stale = False
 
-            self.session = aiohttp.ClientSession(headers=headers)
-        return self.session
+    async def get_session(self):
+        if self.session is not None and not self.session.closed:
+            return self.session
+
+        if self._owned_session is None or self._owned_session.closed:
+            # Same tuning as the bot-wide session: bounded pool, keep-alive
+            # and DNS caching for the single clist.by host
+            self._owned_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=20,
+                    limit_per_host=8,
+                    keepalive_timeout=60,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=10, connect=3)
+            )
+        return self._owned_session
 
     async def close(self):
-        if self.session and not self.session.closed:
-            await self.session.close()
+        # Only close the fallback session; the shared one belongs to the bot
+        if self._owned_session and not self._owned_session.closed:
+            await self._owned_session.close()
 
     async def fetch_upcoming_contests(self, days: int = 3) -> List[Dict]:
-        """Fetch upcoming contests from API."""
+        """Fetch upcoming contests from API (with short-TTL memory cache)."""
+        now = time.monotonic()
+        cached = self._cache.get(days)
+        if cached and now - cached[0] < self._cache_ttl:
+            logging.info("Returning cached contests for %s day(s)", days)
+            self.last_was_stale = False
+            return cached[1]
+
         try:
             session = await self.get_session()
 
             # Time range for API - start from today's 00:00 UTC to get all today's contests
-            start_time = datetime.utcnow().replace(
-                hour=0, minute=0, second=0, microsecond=0)
+            start_time = datetime.now(timezone.utc).replace(
+                hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
             end_time = start_time + timedelta(days=days)
 
             params = {
+                **self._static_params,
                 'start__gte': start_time.strftime('%Y-%m-%dT%H:%M:%S'),
-                'start__lte': end_time.strftime('%Y-%m-%dT%H:%M:%S'),
-                'resource__in': ','.join(self.platforms),
-                'order_by': 'start',
-                'format': 'json',
-                'limit': 1000  # Get more contests for caching
+                'start__lte': end_time.strftime('%Y-%m-%dT%H:%M:%S')
             }
 
-            # Log the complete URL being used
-            url_with_params = f"{self.base_url}?" + \
-                "&".join([f"{k}={v}" for k, v in params.items()])
-            logging.info(f"Fetching contests from: {url_with_params}")
-
-            async with session.get(self.base_url, params=params) as response:
-                logging.info(f"API Response Status: {response.status}")
+            logging.debug("Fetching contests: %s params=%s",
+                          self.base_url, params)
+
+            # Conditional request: if we hold validators from the last 200,
+            # a 304 lets us keep the parsed cache without re-downloading
+            headers = self._headers
+            if cached and (cached[2] or cached[3]):
+                headers = dict(self._headers)
+                if cached[2]:
+                    headers['If-None-Match'] = cached[2]
+                if cached[3]:
+                    headers['If-Modified-Since'] = cached[3]
+
+            for attempt in range(3):
+                async with session.get(self.base_url, params=params, headers=headers) as response:
+                    logging.info("API Response Status: %s", response.status)
+
+                    if response.status == 200:
+                        data = _json_loads(await response.read())
+                        contest_count = len(data.get('objects', []))
+                        logging.info(
+                            "Successfully fetched %s contests", contest_count)
+                        processed = self._process_contests(
+                            data.get('objects', []))
+                        self._cache[days] = (now, processed,
+                                             response.headers.get('ETag'),
+                                             response.headers.get('Last-Modified'))
+                        self.last_was_stale = False
+                        return processed
+                    elif response.status == 304 and cached:
+                        logging.info(
+                            "Contest data unchanged (304), refreshing cache TTL for %s day(s)", days)
+                        self._cache[days] = (
+                            now, cached[1], cached[2], cached[3])
+                        self.last_was_stale = False
+                        return cached[1]
+                    elif response.status == 401:
+                        logging.error(
+                            "API Error 401: Unauthorized - Invalid or missing API credentials")
+                        raise Exception("API_UNAUTHORIZED")
+                    elif response.status == 429:
+                        if attempt == 2:
+                            logging.error(
+                                "API Error 429: Rate limited (retries exhausted)")
+                            raise Exception("API_RATE_LIMITED")
+                        # Honor Retry-After when sent, with an exponential
+                        # floor and a cap so one 429 doesn't poison the
+                        # whole cache window
+                        try:
+                            retry_after = int(
+                                response.headers.get('Retry-After', '0'))
+                        except ValueError:
+                            retry_after = 0
+                        delay = min(max(retry_after, 2 ** (attempt + 1)), 30)
+                        logging.warning(
+                            "API rate limited (429), retrying in %ss", delay)
+                    else:
+                        error_text = await response.text()
+                        logging.error("API Error %s: %s",
+                                      response.status, error_text)
+                        raise Exception(f"API_ERROR_{response.status}")
 
-                if response.status == 200:
-                    data = await response.json()
-                    contest_count = len(data.get('objects', []))
-                    logging.info(
-                        f"Successfully fetched {contest_count} contests")
-                    return self._process_contests(data.get('objects', []))
-                elif response.status == 401:
-                    logging.error(
-                        "API Error 401: Unauthorized - Invalid or missing API credentials")
-                    raise Exception("API_UNAUTHORIZED")
-                elif response.status == 429:
-                    logging.error("API Error 429: Rate limited")
-                    raise Exception("API_RATE_LIMITED")
-                else:
-                    error_text = await response.text()
-                    logging.error(f"API Error {response.status}: {error_text}")
-                    raise Exception(f"API_ERROR_{response.status}")
+                await asyncio.sleep(delay)
 
         except Exception as e:
-            logging.error(f"Contest fetch error: {e}")
+            # Serve stale data instead of nothing while the API is down
+            if cached and now - cached[0] < self._stale_ttl:
+                logging.warning(
+                    "Contest fetch failed (%s), serving stale cache for %s day(s)", e, days)
+                self.last_was_stale = True
+                return cached[1]
+            logging.error("Contest fetch error: %s", e)
             raise e
 
+    async def prewarm(self, day_windows: tuple = (1, 3, 7)) -> None:
+        """Warm the memory cache for the common day windows in parallel.
+
+        The fetches are independent HTTP calls, so asyncio.gather collapses
+        total latency from the sum of the requests to the slowest one.
+        """
+        results = await asyncio.gather(
+            *(self.fetch_upcoming_contests(days) for days in day_windows),
+            return_exceptions=True
+        )
+        for days, result in zip(day_windows, results):
+            if isinstance(result, Exception):
+                logging.warning(
+                    "Cache prewarm for %s day(s) failed: %s", days, result)
+
     def _process_contests(self, raw_contests: List[Dict]) -> List[Dict]:
         """Process and format contest data."""
-        processed = []
-        platform_names = {
-            'codeforces.com': 'Codeforces',
-            'codechef.com': 'CodeChef',
-            'atcoder.jp': 'AtCoder',
-            'leetcode.com': 'LeetCode'
-        }
+        # The result can't exceed the input, so preallocate the slots and
+        # trim the tail instead of growing the list append by append
+        processed: List[Optional[Dict]] = [None] * len(raw_contests)
+        count = 0
 
         for contest in raw_contests:
             try:
-                # Parse start time to IST
-                start_dt = datetime.fromisoformat(
-                    contest['start'].replace('Z', '+00:00'))
-                if start_dt.tzinfo is None:
-                    start_dt = start_dt.replace(tzinfo=pytz.UTC)
-                ist_time = start_dt.astimezone(pytz.timezone('Asia/Kolkata'))
+                # One lookup covers both display name and emoji
+                platform_name, platform_emoji = PLATFORM_INFO.get(
+                    contest['resource'], (contest['resource'], '⚪'))
+
+                # Parse start time to IST. clist.by returns a fixed
+                # 'YYYY-MM-DDTHH:MM:SS' UTC layout, so slice directly and
+                # shift by the constant offset; fall back to fromisoformat
+                # for anything unexpected
+                raw_start = contest['start']
+                try:
+                    start_utc = datetime(
+                        int(raw_start[0:4]), int(raw_start[5:7]),
+                        int(raw_start[8:10]), int(raw_start[11:13]),
+                        int(raw_start[14:16]), int(raw_start[17:19]))
+                except (ValueError, IndexError):
+                    start_dt = datetime.fromisoformat(
+                        raw_start.replace('Z', '+00:00'))
+                    if start_dt.tzinfo is None:
+                        start_dt = start_dt.replace(tzinfo=UTC)
+                    start_utc = start_dt.astimezone(UTC).replace(tzinfo=None)
+
+                ist_time = start_utc + IST_OFFSET
 
                 # Calculate end time
                 duration_seconds = contest.get('duration', 0)
-                end_dt = start_dt + timedelta(seconds=duration_seconds)
-                ist_end_time = end_dt.astimezone(pytz.timezone('Asia/Kolkata'))
+                ist_end_time = ist_time + timedelta(seconds=duration_seconds)
 
                 # Format duration
                 duration_str = self._format_duration(duration_seconds)
 
-                processed.append({
-                    'id': f"{contest['resource']}_{hash(contest['event'])}",
+                # Builtin hash() is salted per process, so the same contest
+                # got a new ID on every restart and the DB cache re-inserted
+                # instead of updating; prefer clist.by's own stable id and
+                # fall back to a deterministic blake2b digest
+                contest_id = contest.get('id') or hashlib.blake2b(
+                    contest['event'].encode(), digest_size=8).hexdigest()
+
+                start_str = format_ist_time(ist_time)
+                url = contest.get('href', '')
+
+                # Pre-render the /contests field entry once per refresh so
+                # command invocations just join the stored strings
+                display_entry = (
+                    f"**{contest['event']}**\n"
+                    f"Start: {start_str}\n"
+                    f"Duration: {duration_str}"
+                ) + (f"\n[Contest Link]({url})" if url else "")
+
+                processed[count] = {
+                    'id': f"{contest['resource']}_{contest_id}",
                     'name': contest['event'],
-                    'platform': platform_names.get(contest['resource'], contest['resource']),
-                    'start_time': ist_time.strftime('%B %d, %Y at %I:%M %p IST'),
-                    'end_time': ist_end_time.strftime('%B %d, %Y at %I:%M %p IST'),
+                    'platform': platform_name,
+                    'start_time': start_str,
+                    'end_time': format_ist_time(ist_end_time),
+                    'start_dt_ist': ist_time,
+                    'display_entry': display_entry,
                     'duration': duration_str,
                     'duration_seconds': duration_seconds,
-                    'url': contest.get('href', ''),
-                    'platform_emoji': self._get_emoji(contest['resource']),
+                    'url': url,
+                    'platform_emoji': platform_emoji,
                     'platform_key': contest['resource']
-                })
+                }
+                count += 1
             except Exception as e:
-                logging.warning(f"Error processing contest: {e}")
+                logging.warning("Error processing contest: %s", e)
                 continue
 
+        del processed[count:]
         return processed
 
     def _format_duration(self, seconds: int) -> str:
         """Format duration in seconds to readable string."""
-        if not seconds:
-            return "Unknown"
-
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-
-        if hours and minutes:
-            return f"{hours}h {minutes}m"
-        elif hours:
-            return f"{hours}h"
-        elif minutes:
-            return f"{minutes}m"
-        else:
-            return "< 1m"
+        return _format_duration(seconds)
 
-    def _get_emoji(self, platform: str) -> str:
-        """Get emoji for platform."""
-        emojis = {
-            'codeforces.com': '🔵',
-            'codechef.com': '🟤',
-            'atcoder.jp': '🟠',
-            'leetcode.com': '🟡'
-        }
-        return emojis.get(platform, '⚪')
-
-    def _get_contest_status(self, start_time_str: str, duration_seconds: int) -> str:
+    def _get_contest_status(self, contest: Dict) -> str:
         """Determine contest status based on current time."""
         try:
-            # Parse the formatted start time back to datetime
-            start_time_clean = start_time_str.replace(' IST', '')
-            start_dt = datetime.strptime(
-                start_time_clean, '%B %d, %Y at %I:%M %p')
+            # Prefer the naive-IST datetime carried on the contest dict;
+            # only re-parse the human-formatted string when it is missing
+            start_dt = contest.get('start_dt_ist')
+            if start_dt is None:
+                start_time_clean = contest['start_time'].replace(' IST', '')
+                start_dt = datetime.strptime(
+                    start_time_clean, '%B %d, %Y at %I:%M %p')
 
-            # Convert to IST timezone for comparison
-            ist_tz = pytz.timezone('Asia/Kolkata')
-            start_dt = ist_tz.localize(start_dt)
-            end_dt = start_dt + timedelta(seconds=duration_seconds)
+            end_dt = start_dt + \
+                timedelta(seconds=contest.get('duration_seconds', 0) or 0)
 
-            # Get current time in IST
-            now_ist = datetime.now(ist_tz)
+            # Naive IST "now" to match the stored naive IST datetimes
+            now_ist = datetime.now(timezone.utc).replace(
+                tzinfo=None) + IST_OFFSET
 
             if now_ist < start_dt:
                 return "upcoming"
@@ -228,72 +468,20 @@ class ContestAPI:
 
     def _get_status_emoji(self, status: str) -> str:
         """Get emoji for contest status."""
-        status_emojis = {
-            'upcoming': '⏰',
-            'running': '🔴',
-            'ended': '✅',
-            'unknown': '❓'
-        }
-        return status_emojis.get(status, '❓')
+        return STATUS_EMOJIS.get(status, '❓')
 
     async def fetch_todays_contests(self) -> List[Dict]:
-        """Fetch contests from today's 00:00 hours to capture all of today's contests."""
-        try:
-            session = await self.get_session()
-
-            # Get today's start time at 00:00 UTC
-            today_start = datetime.utcnow().replace(
-                hour=0, minute=0, second=0, microsecond=0)
-            today_end = today_start + timedelta(days=1)
-
-            params = {
-                'start__gte': today_start.strftime('%Y-%m-%dT%H:%M:%S'),
-                'start__lte': today_end.strftime('%Y-%m-%dT%H:%M:%S'),
-                'resource__in': ','.join(self.platforms),
-                'order_by': 'start',
-                'format': 'json',
-                'limit': 1000
-            }
-
-            # Log the complete URL being used
-            url_with_params = f"{self.base_url}?" + \
-                "&".join([f"{k}={v}" for k, v in params.items()])
-            logging.info(f"Fetching today's contests from: {url_with_params}")
-
-            async with session.get(self.base_url, params=params) as response:
-                logging.info(f"API Response Status: {response.status}")
-
-                if response.status == 200:
-                    data = await response.json()
-                    contest_count = len(data.get('objects', []))
-                    logging.info(
-                        f"Successfully fetched {contest_count} today's contests")
-                    return self._process_contests(data.get('objects', []))
-                elif response.status == 401:
-                    logging.error(
-                        "API Error 401: Unauthorized - Invalid or missing API credentials")
-                    raise Exception("API_UNAUTHORIZED")
-                elif response.status == 429:
-                    logging.error("API Error 429: Rate limited")
-                    raise Exception("API_RATE_LIMITED")
-                else:
-                    error_text = await response.text()
-                    logging.error(f"API Error {response.status}: {error_text}")
-                    raise Exception(f"API_ERROR_{response.status}")
+        """Fetch contests from today's 00:00 hours to capture all of today's contests.
 
-        except Exception as e:
-            logging.error(f"Today's contest fetch error: {e}")
-            raise e
+        Same window as a one-day upcoming fetch, so delegate to it — this
+        also picks up the memory cache, conditional requests and
+        stale-serving for free.
+        """
+        return await self.fetch_upcoming_contests(days=1)
 
     def _get_platform_name_from_key(self, platform_key: str) -> str:
         """Get platform display name from platform key."""
-        key_to_name = {
-            'codeforces.com': 'Codeforces',
-            'codechef.com': 'CodeChef',
-            'atcoder.jp': 'AtCoder',
-            'leetcode.com': 'LeetCode'
-        }
-        return key_to_name.get(platform_key, platform_key)
+        return PLATFORM_NAMES.get(platform_key, platform_key)
 
 
 class ContestCommands(commands.Cog):
@@ -301,7 +489,7 @@ class ContestCommands(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.api = ContestAPI()
+        self.api = ContestAPI(session=getattr(bot, 'http_session', None))
         self.platform_map = {
             'codeforces': 'codeforces.com',
             'codechef': 'codechef.com',
@@ -309,14 +497,29 @@ class ContestCommands(commands.Cog):
             'leetcode': 'leetcode.com'
         }
 
+        # Cache of fully-assembled /contests embeds (as to_dict() payloads)
+        # keyed by (days, platform, limit); start_time strings are fixed
+        # IST text, so a cached embed stays valid for the data TTL
+        self._embed_cache: Dict[tuple, tuple] = {}
+        self._embed_cache_ttl = self.api._cache_ttl
+
+        # In-memory mirror of guild -> contest channel so re-running
+        # /contest_setup with the same channel skips the DB write
+        self._contest_channel_cache: Dict[int, int] = {}
+
+        # Single-flight guard for background DB cache refreshes
+        self._db_refresh_lock = asyncio.Lock()
+
         # Start background tasks
         self.refresh_contest_cache.start()
-        self.daily_announcements.start()
+        self._announce_wakeup = asyncio.Event()
+        self._announce_task = asyncio.create_task(
+            self._announcement_scheduler())
 
     async def cog_unload(self):
         """Clean up when cog is unloaded."""
         self.refresh_contest_cache.cancel()
-        self.daily_announcements.cancel()
+        self._announce_task.cancel()
         await self.api.close()
 
     @tasks.loop(hours=6)  # Refresh cache every 6 hours
@@ -325,7 +528,12 @@ class ContestCommands(commands.Cog):
         try:
             logging.info("Refreshing contest cache...")
             cached_count = await self.bot.db.fetch_and_cache_contests(self.api, max_days=30)
+            # Assembled embeds were built from the old data
+            self._embed_cache.clear()
             logging.info(f"Cache refreshed with {cached_count} contests")
+            # Warm the short-TTL memory cache for the common /contests
+            # windows while we're already off the interaction path
+            await self.api.prewarm()
         except Exception as e:
             logging.error(f"Error refreshing contest cache: {e}")
 
@@ -334,85 +542,117 @@ class ContestCommands(commands.Cog):
         """Wait for bot to be ready before starting cache refresh."""
         await self.bot.wait_until_ready()
 
-    @tasks.loop(minutes=5)  # Check every 5 minutes - optimal balance
-    async def daily_announcements(self):
-        """Background task for daily contest announcements."""
-        try:
-            # Get current time in IST
-            ist_timezone = pytz.timezone('Asia/Kolkata')
-            current_time_ist = datetime.now(ist_timezone)
-            current_hour_min = current_time_ist.strftime('%H:%M')
+    async def _announcement_scheduler(self):
+        """Event-driven daily contest announcements.
 
-            logging.debug(
-                f"Checking announcements at IST time: {current_hour_min}")
-
-            # Get all configured contest channels
-            channels = await self.bot.db.get_all_contest_channels()
+        Instead of polling every few minutes, sleep until the earliest
+        configured fire time across all guilds (re-planning at least every
+        15 minutes to pick up external config changes); /contest_setup and
+        /contest_time set the wakeup event so edits take effect at once.
+        """
+        await self.bot.wait_until_ready()
 
-            for guild_id, channel_id in channels.items():
-                try:
-                    # Check if announcement should be sent today
-                    if not await self.bot.db.should_send_announcement(guild_id):
-                        logging.debug(
-                            f"Guild {guild_id}: Announcement already sent today")
+        while True:
+            try:
+                schedule = await self.bot.db.get_announcement_schedule()
+                now_ist = datetime.now(timezone.utc).replace(
+                    tzinfo=None) + IST_OFFSET
+                today = datetime.now().date().isoformat()
+
+                due = []
+                next_wait = 900.0
+                for guild_id, (channel_id, announce_minutes, last_sent) in schedule.items():
+                    hour, minute = divmod(announce_minutes, 60)
+                    target = now_ist.replace(
+                        hour=hour, minute=minute,
+                        second=0, microsecond=0)
+
+                    if last_sent == today or target <= now_ist - timedelta(minutes=5):
+                        # Already sent, or missed the window — next fire
+                        # is tomorrow
+                        target += timedelta(days=1)
+                    elif target <= now_ist:
+                        due.append(
+                            (guild_id, channel_id, f"{hour:02d}:{minute:02d}"))
                         continue
 
-                    # Get announcement time for this guild
-                    announcement_time = await self.bot.db.get_announcement_time(guild_id)
-
-                    logging.debug(
-                        f"Guild {guild_id}: Current={current_hour_min}, Target={announcement_time}")
-
-                    # Check if current time is within 5-minute window of target time
-                    current_time_obj = datetime.strptime(
-                        current_hour_min, '%H:%M').time()
-                    target_time_obj = datetime.strptime(
-                        announcement_time, '%H:%M').time()
+                    next_wait = min(
+                        next_wait, (target - now_ist).total_seconds())
 
-                    # Convert to minutes for comparison
-                    current_minutes = current_time_obj.hour * 60 + current_time_obj.minute
-                    target_minutes = target_time_obj.hour * 60 + target_time_obj.minute
+                if due:
+                    all_sent = await self._send_due_announcements(due)
+                    if not all_sent:
+                        # A failed guild is still inside its grace window
+                        # and would make this loop hot-spin; wait before
+                        # retrying it
+                        await asyncio.sleep(60)
+                    # Re-plan; the guilds just served now target tomorrow
+                    continue
 
-                    # Allow 5-minute window (current time >= target time and within 5 minutes)
-                    if current_minutes >= target_minutes and current_minutes < target_minutes + 5:
-                        logging.info(
-                            f"Sending announcement to guild {guild_id} at {current_hour_min} (target: {announcement_time})")
-
-                        guild = self.bot.get_guild(guild_id)
-                        if not guild:
-                            logging.warning(f"Guild {guild_id} not found")
-                            continue
-
-                        channel = guild.get_channel(channel_id)
-                        if not channel:
-                            logging.warning(
-                                f"Channel {channel_id} not found in guild {guild_id}")
-                            continue
-
-                        # Send daily contest announcement
-                        await self._send_daily_announcement(channel)
-                        await self.bot.db.mark_announcement_sent(guild_id)
-                        logging.info(
-                            f"Successfully sent announcement to {guild.name}")
-
-                except Exception as e:
-                    logging.error(
-                        f"Error sending daily announcement for guild {guild_id}: {e}")
-
-        except Exception as e:
-            logging.error(f"Error in daily announcements task: {e}")
+                self._announce_wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._announce_wakeup.wait(),
+                        timeout=max(next_wait, 1.0))
+                except asyncio.TimeoutError:
+                    pass
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"Error in announcement scheduler: {e}")
+                await asyncio.sleep(60)
+
+    async def _send_due_announcements(self, due) -> bool:
+        """Send the shared daily embed to every guild whose time has come.
+
+        Returns True when every guild was delivered (or permanently
+        skipped); False when at least one guild should be retried.
+        """
+        daily_embed = None
+        all_sent = True
+        for guild_id, channel_id, announcement_time in due:
+            try:
+                logging.info(
+                    f"Sending announcement to guild {guild_id} (target: {announcement_time})")
+
+                guild = self.bot.get_guild(guild_id)
+                if not guild:
+                    logging.warning(f"Guild {guild_id} not found")
+                    all_sent = False
+                    continue
+
+                channel = guild.get_channel(channel_id)
+                if not channel:
+                    logging.warning(
+                        f"Channel {channel_id} not found in guild {guild_id}")
+                    all_sent = False
+                    continue
+
+                # The embed content is identical for every guild
+                if daily_embed is None:
+                    daily_embed = await self._build_daily_announcement_embed()
+                if daily_embed is None:
+                    all_sent = False
+                    continue
+
+                await channel.send(embed=daily_embed)
+                await self.bot.db.mark_announcement_sent(guild_id)
+                logging.info(
+                    f"Successfully sent announcement to {guild.name}")
 
-    @daily_announcements.before_loop
-    async def before_daily_announcements(self):
-        """Wait for bot to be ready before starting daily announcements."""
-        await self.bot.wait_until_ready()
+            except Exception as e:
+                logging.error(
+                    f"Error sending daily announcement for guild {guild_id}: {e}")
+                all_sent = False
+        return all_sent
 
-    async def _send_daily_announcement(self, channel):
-        """Send daily contest announcement to a channel."""
+    async def _build_daily_announcement_embed(self) -> Optional[discord.Embed]:
+        """Build the daily contest announcement embed (shared across guilds)."""
         try:
-            # Get today's and tomorrow's contests from cache
-            today_contests = await self.bot.db.get_contests_today()
-            tomorrow_contests = await self.bot.db.get_contests_tomorrow()
+            # One range query covers both days; partitioned in the DB layer
+            today_contests, tomorrow_contests = \
+                await self.bot.db.get_contests_today_and_tomorrow()
 
             embed = discord.Embed(
                 title="📅 Daily Contest Update",
@@ -420,37 +660,41 @@ class ContestCommands(commands.Cog):
                 color=0x3498db
             )
 
+            # Bound dict.get beats method dispatch inside the entry loops
+            emoji_for = PLATFORM_EMOJIS.get
+
             if today_contests:
                 today_contest_list = []
                 for contest in today_contests[:5]:
                     try:
-                        emoji = self._get_emoji(contest.get('platform_key', ''))
+                        emoji = emoji_for(
+                            contest.get('platform_key', ''), _DEFAULT_EMOJI)
 
-                        # Get contest status and status emoji (with fallback for missing duration_seconds)
-                        duration_seconds = contest.get('duration_seconds', 0)
-                        status = self.api._get_contest_status(
-                            contest['start_time'], duration_seconds)
+                        # Get contest status and status emoji
+                        status = self.api._get_contest_status(contest)
                         status_emoji = self.api._get_status_emoji(status)
 
-                        entry = f"{emoji} **{contest['name']}** {status_emoji}\n"
-                        entry += f"Platform: {contest['platform']}\n"
-                        entry += f"Start: {contest['start_time']}\n"
-                        entry += f"Duration: {contest['duration']}"
-
-                        if contest.get('url'):
-                            entry += f"\n[Contest Link]({contest['url']})"
+                        # Single f-string per entry instead of repeated +=
+                        # (each += reallocates the whole string)
+                        entry = (
+                            f"{emoji} **{contest['name']}** {status_emoji}\n"
+                            f"Platform: {contest['platform']}\n"
+                            f"Start: {contest['start_time']}\n"
+                            f"Duration: {contest['duration']}"
+                        ) + (f"\n[Contest Link]({contest['url']})" if contest.get('url') else "")
 
                         today_contest_list.append(entry)
                     except Exception as e:
                         logging.warning(
                             f"Error processing today's contest {contest.get('name', 'unknown')}: {e}")
                         # Add contest without status if there's an error
-                        emoji = self._get_emoji(contest.get('platform_key', ''))
-                        entry = f"{emoji} **{contest['name']}**\n"
-                        entry += f"Platform: {contest['platform']}\n"
-                        entry += f"Start: {contest['start_time']}"
-                        if contest.get('url'):
-                            entry += f"\n[Contest Link]({contest['url']})"
+                        emoji = emoji_for(
+                            contest.get('platform_key', ''), _DEFAULT_EMOJI)
+                        entry = (
+                            f"{emoji} **{contest['name']}**\n"
+                            f"Platform: {contest['platform']}\n"
+                            f"Start: {contest['start_time']}"
+                        ) + (f"\n[Contest Link]({contest['url']})" if contest.get('url') else "")
                         today_contest_list.append(entry)
 
                 embed.add_field(
@@ -462,13 +706,14 @@ class ContestCommands(commands.Cog):
             if tomorrow_contests:
                 tomorrow_contest_list = []
                 for contest in tomorrow_contests[:5]:
-                    emoji = self._get_emoji(contest.get('platform_key', ''))
-                    entry = f"{emoji} **{contest['name']}**\n"
-                    entry += f"Platform: {contest['platform']}\n"
-                    entry += f"Start: {contest['start_time']}\n"
-                    entry += f"Duration: {contest.get('duration', 'Unknown')}"
-                    if contest.get('url'):
-                        entry += f"\n[Contest Link]({contest['url']})"
+                    emoji = emoji_for(
+                        contest.get('platform_key', ''), _DEFAULT_EMOJI)
+                    entry = (
+                        f"{emoji} **{contest['name']}**\n"
+                        f"Platform: {contest['platform']}\n"
+                        f"Start: {contest['start_time']}\n"
+                        f"Duration: {contest.get('duration', 'Unknown')}"
+                    ) + (f"\n[Contest Link]({contest['url']})" if contest.get('url') else "")
                     tomorrow_contest_list.append(entry)
 
                 embed.add_field(
@@ -480,7 +725,7 @@ class ContestCommands(commands.Cog):
             if today_contests:
                 embed.add_field(
                     name="Status Legend",
-                    value="⏰ Upcoming • 🔴 Running • ✅ Ended",
+                    value=_STATUS_LEGEND,
                     inline=False
                 )
 
@@ -499,31 +744,135 @@ class ContestCommands(commands.Cog):
                 inline=False
             )
 
-            embed.set_footer(text="All times in IST • Data from clist.by")
-            await channel.send(embed=embed)
+            embed.set_footer(text=_IST_FOOTER)
+            return embed
 
         except Exception as e:
-            logging.error(f"Error sending daily announcement: {e}")
+            logging.error(f"Error building daily announcement: {e}")
+            return None
 
     def _get_emoji(self, platform: str) -> str:
         """Get emoji for platform."""
-        emojis = {
-            'codeforces.com': '🔵',
-            'codechef.com': '🟤',
-            'atcoder.jp': '🟠',
-            'leetcode.com': '🟡'
-        }
-        return emojis.get(platform, '⚪')
+        return PLATFORM_EMOJIS.get(platform, _DEFAULT_EMOJI)
+
+    def _render_contest_entries(self, contests: List[Dict], with_status: bool = False) -> List[str]:
+        """Render contests as the per-contest entry strings used by embeds."""
+        # Bind lookups once outside the loop; dict.get directly instead of
+        # dispatching through the _get_emoji wrapper per contest
+        emoji_for = PLATFORM_EMOJIS.get
+        get_status = self.api._get_contest_status
+        get_status_emoji = self.api._get_status_emoji
+
+        entries = []
+        for contest in contests:
+            name, plat, start, url = (
+                contest['name'], contest['platform'],
+                contest['start_time'], contest.get('url'))
+            emoji = emoji_for(contest.get('platform_key', ''), _DEFAULT_EMOJI)
+            link = f"\n[Contest Link]({url})" if url else ""
+
+            if with_status:
+                try:
+                    status_emoji = get_status_emoji(get_status(contest))
+                    entries.append(
+                        f"{emoji} **{name}** {status_emoji}\n"
+                        f"Platform: {plat}\n"
+                        f"Start: {start}\n"
+                        f"Duration: {contest['duration']}{link}"
+                    )
+                    continue
+                except Exception as e:
+                    logging.warning(
+                        f"Error processing contest {contest.get('name', 'unknown')}: {e}")
+                    # Fall through to the plain entry without status
+                    entries.append(
+                        f"{emoji} **{name}**\n"
+                        f"Platform: {plat}\n"
+                        f"Start: {start}{link}"
+                    )
+                    continue
+
+            entries.append(
+                f"{emoji} **{name}**\n"
+                f"Platform: {plat}\n"
+                f"Start: {start}\n"
+                f"Duration: {contest.get('duration', 'Unknown')}{link}"
+            )
+        return entries
+
+    def _build_contest_embeds(self, contests: List[Dict], title: str,
+                              description: str, field_name: str, empty_msg: str,
+                              color: int, with_status: bool = False,
+                              add_legend: bool = False) -> List[discord.Embed]:
+        """Build the day-schedule embeds shared by today/tomorrow commands.
+
+        Entries are chunked four to an embed so a busy day never runs into
+        Discord's 1024-char field / 6000-char embed limits, and the whole
+        batch still goes out as a single message.
+        """
+        if not contests:
+            embed = discord.Embed(title=title, description=empty_msg, color=0xe74c3c)
+            embed.set_footer(text=_IST_FOOTER)
+            return [embed]
+
+        entries = self._render_contest_entries(contests, with_status=with_status)
+
+        embeds = []
+        for start in range(0, len(entries), 4):
+            chunk = "\n\n".join(entries[start:start + 4])
+            if start == 0:
+                embed = discord.Embed(
+                    title=title, description=description, color=color)
+                embed.add_field(name=field_name, value=chunk, inline=False)
+            else:
+                embed = discord.Embed(color=color)
+                embed.add_field(
+                    name=f"{field_name} (continued)", value=chunk, inline=False)
+            embeds.append(embed)
+
+        if add_legend:
+            embeds[-1].add_field(
+                name="Status Legend",
+                value=_STATUS_LEGEND,
+                inline=False
+            )
+        embeds[-1].set_footer(text=_IST_FOOTER)
+
+        # Discord allows at most 10 embeds per message
+        return embeds[:10]
+
+    @staticmethod
+    def _log_send_error(task: asyncio.Task):
+        """Surface failures from fire-and-forget channel sends."""
+        if not task.cancelled() and task.exception():
+            logging.error(f"Background channel send failed: {task.exception()}")
+
+    async def _refresh_db_cache(self):
+        """Refresh the SQLite contest cache, one refresh at a time.
+
+        Callers that arrive while a refresh is running queue on the lock;
+        the staleness re-check means they return without a second fetch.
+        """
+        async with self._db_refresh_lock:
+            try:
+                if await self.bot.db.is_cache_stale():
+                    await self.bot.db.fetch_and_cache_contests(self.api, max_days=30)
+                    # Assembled embeds were built from the old data
+                    self._embed_cache.clear()
+            except Exception as e:
+                logging.error(f"Background contest cache refresh failed: {e}")
 
     async def _get_contests_from_cache_or_api(self, platform: Optional[str] = None,
                                               limit: Optional[int] = None,
-                                              days: int = 3) -> List[Dict]:
-        """Get contests from cache if available, otherwise fetch from API."""
+                                              days: int = 3) -> Dict[str, List[Dict]]:
+        """Get contests grouped by platform from cache, or the API on failure."""
         try:
-            # Check if cache is stale
-            if await self.bot.db.is_cache_stale():
-                logging.info("Cache is stale, refreshing...")
-                await self.bot.db.fetch_and_cache_contests(self.api, max_days=30)
+            # Stale-while-revalidate: serve whatever the cache holds right
+            # away and refresh it off the interaction path
+            stale = await self.bot.db.is_cache_stale()
+            if stale:
+                logging.info("Cache is stale, refreshing in background...")
+                asyncio.create_task(self._refresh_db_cache())
 
             # Get from cache with proper date range
             start_date = datetime.now().date().isoformat()
@@ -537,14 +886,25 @@ class ContestCommands(commands.Cog):
                 logging.info(
                     f"Filtering by platform: {platform} -> {platform_key}")
 
-            contests = await self.bot.db.get_cached_contests(
+            contests = await self.bot.db.get_cached_contests_grouped(
                 platform=platform_key,
                 limit=limit,
                 start_date=start_date,
                 end_date=end_date
             )
 
-            logging.info(f"Retrieved {len(contests)} contests from cache")
+            # Nothing to serve stale — wait for the refresh and re-query
+            if not contests and stale:
+                await self._refresh_db_cache()
+                contests = await self.bot.db.get_cached_contests_grouped(
+                    platform=platform_key,
+                    limit=limit,
+                    start_date=start_date,
+                    end_date=end_date
+                )
+
+            logging.info("Retrieved %s contests from cache",
+                         sum(len(group) for group in contests.values()))
             return contests
 
         except Exception as e:
@@ -553,26 +913,65 @@ class ContestCommands(commands.Cog):
             # Fallback to API - fetch and filter manually
             api_contests = await self.api.fetch_upcoming_contests(days)
 
-            # Apply platform filter if specified
+            # Apply platform filter if specified; processed contests carry
+            # platform_key, so filter on that directly instead of reverse-
+            # mapping the key to a display name first
             if platform and platform.lower() in self.platform_map:
-                platform_name = None
-                for name, key in {'Codeforces': 'codeforces.com', 'CodeChef': 'codechef.com',
-                                  'AtCoder': 'atcoder.jp', 'LeetCode': 'leetcode.com'}.items():
-                    if key == self.platform_map[platform.lower()]:
-                        platform_name = name
-                        break
-
-                if platform_name:
-                    api_contests = [
-                        c for c in api_contests if c['platform'] == platform_name]
-                    logging.info(
-                        f"Filtered API results to {len(api_contests)} contests for {platform_name}")
+                wanted_key = self.platform_map[platform.lower()]
+                api_contests = [
+                    c for c in api_contests if c.get('platform_key') == wanted_key]
+                logging.info(
+                    f"Filtered API results to {len(api_contests)} contests for {wanted_key}")
 
             # Apply limit if specified
             if limit:
                 api_contests = api_contests[:limit]
 
-            return api_contests
+            return group_by_platform(api_contests)
+
+    def _build_contests_embed(self, platform_contests: Dict[str, List[Dict]],
+                              total_contests: int, days: int,
+                              platform: Optional[str]) -> discord.Embed:
+        """Assemble the /contests embed from pre-grouped contests.
+
+        No awaits — safe to run in a thread executor.
+        """
+        embed = discord.Embed(
+            title="🏆 Upcoming Programming Contests",
+            description=f"Found **{total_contests}** contest(s) in the next **{days}** day(s)" +
+            (f" for **{platform}**" if platform else ""),
+            color=0x3498db
+        )
+
+        for platform_name, contests_list in platform_contests.items():
+            formatted = []
+            display_limit = min(len(contests_list), 5)
+            platform_emoji = self._get_emoji(contests_list[0].get(
+                'platform_key', '')) if contests_list else '⚪'
+
+            for contest in contests_list[:display_limit]:
+                # Entries are pre-rendered when contests are processed
+                # or read from the DB cache
+                entry = contest.get('display_entry')
+                if entry is None:
+                    entry = (
+                        f"**{contest['name']}**\n"
+                        f"Start: {contest['start_time']}\n"
+                        f"Duration: {contest.get('duration', 'Unknown')}"
+                    )
+                    if contest.get('url'):
+                        entry += f"\n[Contest Link]({contest['url']})"
+                formatted.append(entry)
+
+            if formatted:
+                embed.add_field(
+                    name=f"{platform_emoji} {platform_name}",
+                    value="\n\n".join(formatted),
+                    inline=False
+                )
+
+        embed.set_footer(text=_IST_FOOTER)
+        return embed
 
     @app_commands.command(name="contests", description="Show upcoming programming contests (IST timezone)")
     @app_commands.describe(
@@ -595,7 +994,10 @@ class ContestCommands(commands.Cog):
             await interaction.response.send_message("❌ Limit must be between 1 and 20.", ephemeral=True)
             return
 
-        if platform and platform.lower() not in self.platform_map:
+        # Normalize the platform once; every later check reuses the
+        # lowercased string instead of re-allocating it
+        platform_low = platform.lower() if platform else None
+        if platform_low and platform_low not in self.platform_map:
             available = ", ".join(self.platform_map.keys())
             await interaction.response.send_message(f"❌ Invalid platform. Available: {available}", ephemeral=True)
             return
@@ -605,10 +1007,21 @@ class ContestCommands(commands.Cog):
         try:
             logging.info(
                 f"Contest command: days={days}, platform={platform}, limit={limit}")
-            contests = await self._get_contests_from_cache_or_api(platform, limit, days)
-            logging.info(f"Retrieved {len(contests)} contests for display")
 
-            if not contests:
+            # Serve a ready-made embed when the data TTL hasn't lapsed —
+            # skips the cache/API fetch and the embed-construction loop
+            cache_key = (days, platform_low, limit)
+            cached_embed = self._embed_cache.get(cache_key)
+            if cached_embed and time.monotonic() - cached_embed[0] < self._embed_cache_ttl:
+                await interaction.followup.send(embed=discord.Embed.from_dict(cached_embed[1]))
+                return
+
+            platform_contests = await self._get_contests_from_cache_or_api(platform_low, limit, days)
+            total_contests = sum(len(group)
+                                 for group in platform_contests.values())
+            logging.info("Retrieved %s contests for display", total_contests)
+
+            if not platform_contests:
                 embed = discord.Embed(
                     title="📅 No Upcoming Contests",
                     description=f"No contests found in the next {days} day(s)" +
@@ -618,45 +1031,13 @@ class ContestCommands(commands.Cog):
                 await interaction.followup.send(embed=embed)
                 return
 
-            # Group by platform
-            platform_contests = {}
-            for contest in contests:
-                platform_name = contest.get('platform', 'Unknown')
-                if platform_name not in platform_contests:
-                    platform_contests[platform_name] = []
-                platform_contests[platform_name].append(contest)
-
-            embed = discord.Embed(
-                title="🏆 Upcoming Programming Contests",
-                description=f"Found **{len(contests)}** contest(s) in the next **{days}** day(s)" +
-                (f" for **{platform}**" if platform else ""),
-                color=0x3498db
-            )
-
-            for platform_name, contests_list in platform_contests.items():
-                formatted = []
-                display_limit = min(len(contests_list), 5)
-                platform_emoji = self._get_emoji(contests_list[0].get(
-                    'platform_key', '')) if contests_list else '⚪'
-
-                for contest in contests_list[:display_limit]:
-                    entry = (
-                        f"**{contest['name']}**\n"
-                        f"Start: {contest['start_time']}\n"
-                        f"Duration: {contest.get('duration', 'Unknown')}"
-                    )
-                    if contest.get('url'):
-                        entry += f"\n[Contest Link]({contest['url']})"
-                    formatted.append(entry)
+            # Pure CPU work — push it off the event loop so other
+            # interactions aren't blocked behind a large embed build
+            embed = await asyncio.get_running_loop().run_in_executor(
+                None, self._build_contests_embed,
+                platform_contests, total_contests, days, platform)
 
-                if formatted:
-                    embed.add_field(
-                        name=f"{platform_emoji} {platform_name}",
-                        value="\n\n".join(formatted),
-                        inline=False
-                    )
-
-            embed.set_footer(text="All times in IST • Data from clist.by")
+            self._embed_cache[cache_key] = (time.monotonic(), embed.to_dict())
             await interaction.followup.send(embed=embed)
 
         except Exception as e:
@@ -683,7 +1064,8 @@ class ContestCommands(commands.Cog):
             await interaction.response.send_message("❌ Limit must be between 1 and 10.", ephemeral=True)
             return
 
-        if platform and platform.lower() not in self.platform_map:
+        platform_low = platform.lower() if platform else None
+        if platform_low and platform_low not in self.platform_map:
             available = ", ".join(self.platform_map.keys())
             await interaction.response.send_message(f"❌ Invalid platform. Available: {available}", ephemeral=True)
             return
@@ -692,7 +1074,7 @@ class ContestCommands(commands.Cog):
 
         try:
             platform_key = self.platform_map.get(
-                platform.lower()) if platform else None
+                platform_low) if platform_low else None
 
             # First try to use cached data
             contests = await self.bot.db.get_contests_today(platform=platform_key, limit=limit)
@@ -722,67 +1104,18 @@ class ContestCommands(commands.Cog):
                         await interaction.followup.send("❌ Failed to fetch contest data. Please try again later.", ephemeral=True)
                         return
 
-            embed = discord.Embed(
+            embeds = self._build_contest_embeds(
+                contests,
                 title="📅 Today's Programming Contests",
-                description="Real-time contest tracking with status updates",
-                color=0x27ae60
+                description=f"Found **{len(contests)}** contest(s) for today",
+                field_name="Today's Schedule",
+                empty_msg="No contests for today" +
+                (f" on {platform}" if platform else "") + ".",
+                color=0x27ae60,
+                with_status=True,
+                add_legend=True
             )
-
-            if contests:
-                contest_list = []
-                for contest in contests:
-                    try:
-                        emoji = self._get_emoji(
-                            contest.get('platform_key', ''))
-
-                        # Get contest status and status emoji (with fallback for missing duration_seconds)
-                        duration_seconds = contest.get('duration_seconds', 0)
-                        status = self.api._get_contest_status(
-                            contest['start_time'], duration_seconds)
-                        status_emoji = self.api._get_status_emoji(status)
-
-                        entry = f"{emoji} **{contest['name']}** {status_emoji}\n"
-                        entry += f"Platform: {contest['platform']}\n"
-                        entry += f"Start: {contest['start_time']}\n"
-                        entry += f"Duration: {contest['duration']}"
-
-                        if contest.get('url'):
-                            entry += f"\n[Contest Link]({contest['url']})"
-
-                        contest_list.append(entry)
-                    except Exception as e:
-                        logging.warning(
-                            f"Error processing contest {contest.get('name', 'unknown')}: {e}")
-                        # Add contest without status if there's an error
-                        emoji = self._get_emoji(
-                            contest.get('platform_key', ''))
-                        entry = f"{emoji} **{contest['name']}**\n"
-                        entry += f"Platform: {contest['platform']}\n"
-                        entry += f"Start: {contest['start_time']}"
-                        if contest.get('url'):
-                            entry += f"\n[Contest Link]({contest['url']})"
-                        contest_list.append(entry)
-
-                embed.description = f"Found **{len(contests)}** contest(s) for today"
-                embed.add_field(
-                    name="Today's Schedule",
-                    value="\n\n".join(contest_list),
-                    inline=False
-                )
-
-                # Add status legend
-                embed.add_field(
-                    name="Status Legend",
-                    value="⏰ Upcoming • 🔴 Running • ✅ Ended",
-                    inline=False
-                )
-            else:
-                embed.description = "No contests for today" + \
-                    (f" on {platform}" if platform else "") + "."
-                embed.color = 0xe74c3c
-
-            embed.set_footer(text="All times in IST • Data from clist.by")
-            await interaction.followup.send(embed=embed)
+            await interaction.followup.send(embeds=embeds)
 
         except Exception as e:
             logging.error(f"Today's contests command error: {e}")
@@ -807,7 +1140,8 @@ class ContestCommands(commands.Cog):
             await interaction.response.send_message("❌ Limit must be between 1 and 10.", ephemeral=True)
             return
 
-        if platform and platform.lower() not in self.platform_map:
+        platform_low = platform.lower() if platform else None
+        if platform_low and platform_low not in self.platform_map:
             available = ", ".join(self.platform_map.keys())
             await interaction.response.send_message(f"❌ Invalid platform. Available: {available}", ephemeral=True)
             return
@@ -816,40 +1150,19 @@ class ContestCommands(commands.Cog):
 
         try:
             platform_key = self.platform_map.get(
-                platform.lower()) if platform else None
+                platform_low) if platform_low else None
             contests = await self.bot.db.get_contests_tomorrow(platform=platform_key, limit=limit)
 
-            embed = discord.Embed(
+            embeds = self._build_contest_embeds(
+                contests,
                 title="🌅 Tomorrow's Programming Contests",
-                description="Plan ahead with tomorrow's contest schedule",
+                description=f"Found **{len(contests)}** contest(s) starting tomorrow",
+                field_name="Tomorrow's Schedule",
+                empty_msg="No contests starting tomorrow" +
+                (f" for {platform}" if platform else "") + ".",
                 color=0x3498db
             )
-
-            if contests:
-                contest_list = []
-                for contest in contests:
-                    emoji = self._get_emoji(contest.get('platform_key', ''))
-                    entry = f"{emoji} **{contest['name']}**\n"
-                    entry += f"Platform: {contest['platform']}\n"
-                    entry += f"Start: {contest['start_time']}\n"
-                    entry += f"Duration: {contest.get('duration', 'Unknown')}"
-                    if contest.get('url'):
-                        entry += f"\n[Contest Link]({contest['url']})"
-                    contest_list.append(entry)
-
-                embed.description = f"Found **{len(contests)}** contest(s) starting tomorrow"
-                embed.add_field(
-                    name="Tomorrow's Schedule",
-                    value="\n\n".join(contest_list),
-                    inline=False
-                )
-            else:
-                embed.description = "No contests starting tomorrow" + \
-                    (f" for {platform}" if platform else "") + "."
-                embed.color = 0xe74c3c
-
-            embed.set_footer(text="All times in IST • Data from clist.by")
-            await interaction.followup.send(embed=embed)
+            await interaction.followup.send(embeds=embeds)
 
         except Exception as e:
             logging.error(f"Tomorrow's contests command error: {e}")
@@ -904,25 +1217,39 @@ class ContestCommands(commands.Cog):
             )
             return
 
-        # Save to database
-        await self.bot.db.set_contest_channel(interaction.guild.id, target_channel.id)
-        logging.info(
-            f"Contest channel set to {target_channel.name} for guild {interaction.guild.name}")
+        # Save to database, unless the guild already points at this channel
+        current = self._contest_channel_cache.get(interaction.guild.id)
+        if current is None:
+            current = await self.bot.db.get_contest_channel(interaction.guild.id)
+
+        if current != target_channel.id:
+            await self.bot.db.set_contest_channel(interaction.guild.id, target_channel.id)
+            logging.info(
+                f"Contest channel set to {target_channel.name} for guild {interaction.guild.name}")
+        else:
+            logging.info(
+                f"Contest channel unchanged for guild {interaction.guild.name}, skipping DB write")
+        self._contest_channel_cache[interaction.guild.id] = target_channel.id
+        # Let the scheduler re-plan with the new configuration
+        self._announce_wakeup.set()
 
         embed = discord.Embed(
             title="✅ Contest Channel Configured",
             description=f"Contest announcements will be sent to {target_channel.mention}",
             color=0x27ae60
         )
-        await interaction.response.send_message(embed=embed)
-
-        # Send test message
+        # Send test message concurrently with the confirmation; the
+        # interaction response must be acknowledged first, so the channel
+        # send is fired as a background task rather than awaited after it
         test_embed = discord.Embed(
             title="🎯 Contest Channel Ready",
             description="This channel is now configured for contest announcements!",
             color=0x3498db
         )
-        await target_channel.send(embed=test_embed)
+        test_task = asyncio.create_task(target_channel.send(embed=test_embed))
+        test_task.add_done_callback(self._log_send_error)
+
+        await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="contest_time", description="Set daily announcement time")
     @app_commands.describe(time='Time in HH:MM format (24-hour, IST, default: 09:00)')
@@ -937,14 +1264,14 @@ class ContestCommands(commands.Cog):
             return
 
         # Validate time format
-        try:
-            datetime.strptime(time, '%H:%M')
-        except ValueError:
+        if not _HHMM_RE.fullmatch(time):
             await interaction.response.send_message("❌ Invalid time format. Use HH:MM (24-hour format).", ephemeral=True)
             return
 
         # Save to database
         await self.bot.db.set_announcement_time(interaction.guild.id, time)
+        # Let the scheduler re-plan with the new time
+        self._announce_wakeup.set()
 
         embed = discord.Embed(
             title="⏰ Announcement Time Set",
@@ -968,19 +1295,19 @@ class ContestCommands(commands.Cog):
             await interaction.response.send_message("❌ You need admin permissions to use this command.", ephemeral=True)
             return
 
+        # The deferred response already shows a native "thinking" indicator,
+        # so skip the interim "Refreshing..." embed and just edit the
+        # response once the refresh finishes — one REST call less
         await interaction.response.defer()
 
         try:
-            embed = discord.Embed(
-                title="🔄 Refreshing Contest Cache",
-                description="Fetching latest contest data...",
-                color=0xf39c12
-            )
-            await interaction.followup.send(embed=embed)
-
             # Fetch and cache contests
             cached_count = await self.bot.db.fetch_and_cache_contests(self.api, max_days=30)
 
+            # Drop assembled /contests embeds so the refresh is visible
+            # immediately rather than after the embed-cache TTL
+            self._embed_cache.clear()
+
             # Success embed
             success_embed = discord.Embed(
                 title="✅ Contest Cache Refreshed",
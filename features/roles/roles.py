@@ -6,9 +6,10 @@ Automatic role assignment based on Discord account age.
 from features.admin.admin import is_admin
 from utils.interaction_helpers import safe_response
 import logging
+import time
 import discord
 from discord.ext import commands, tasks
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 import asyncio
 
@@ -22,6 +23,45 @@ class RoleManager(commands.Cog):
         self.VETERAN_ROLE_NAME = "Discord Veteran"
         self.VETERAN_THRESHOLD_YEARS = 5
 
+        # Veteran status only ever flips once per account (when it crosses
+        # the threshold), so cache the boolean per member for a day — the
+        # daily sweep then skips the datetime arithmetic for known members
+        self._veteran_cache: dict[int, tuple[float, bool]] = {}
+        self._veteran_cache_ttl = 86400
+
+        # Cutoff date for the veteran threshold, refreshed once per daily
+        # sweep instead of deriving an age from utcnow() for every member
+        self._veteran_cutoff: Optional[datetime] = None
+
+        # Resolved veteran role id per guild, so repeat lookups hit
+        # guild.get_role instead of scanning guild.roles by name
+        self._veteran_role_ids: dict[int, int] = {}
+
+        # Static portion of the /veteran_info embed, built once; the
+        # handler copies it and appends only the per-user status field
+        self._veteran_info_base = {
+            'title': "🥇 Discord Veteran Role",
+            'description': "Automatic role for long-time Discord users",
+            'color': discord.Color.gold().value,
+            'fields': [
+                {
+                    'name': "📅 Qualification",
+                    'value': f"Discord account must be **{self.VETERAN_THRESHOLD_YEARS}+ years old**",
+                    'inline': False
+                },
+                {
+                    'name': "🤖 Assignment",
+                    'value': "• Automatically assigned when joining the server\n• Daily checks for existing members\n• Manual check available for admins",
+                    'inline': False
+                },
+                {
+                    'name': "🎨 Role Details",
+                    'value': "• Color: Gold\n• Mentionable: Yes\n• Special recognition for Discord veterans",
+                    'inline': False
+                },
+            ],
+        }
+
         # Start background task
         self.veteran_role_check.start()
 
@@ -40,12 +80,27 @@ class RoleManager(commands.Cog):
         - Log statistics and handle errors gracefully
         """
         try:
-            self.logger.info("Starting daily Discord Veteran role check...")
+            # Nothing to do right after connect (or with no guilds at all);
+            # bail before logging or touching the DB
+            if not self.bot.guilds:
+                return
+
+            self.logger.debug("Starting daily Discord Veteran role check...")
 
-            for guild in self.bot.guilds:
-                await self.check_veteran_roles_in_guild(guild)
+            self._veteran_cutoff = self._compute_veteran_cutoff()
 
-            self.logger.info("Completed daily Discord Veteran role check")
+            # Only sweep guilds that opted in via /veteran_enable, so the
+            # daily member walk skips servers that never wanted it.
+            # Guild scans are independent and rate-limit buckets are scoped
+            # per guild, so run them concurrently instead of back to back
+            enabled = await self.bot.db.get_veteran_enabled_guild_ids()
+            await asyncio.gather(
+                *(self.check_veteran_roles_in_guild(guild)
+                  for guild in self.bot.guilds if guild.id in enabled),
+                return_exceptions=True
+            )
+
+            self.logger.debug("Completed daily Discord Veteran role check")
 
         except Exception as e:
             self.logger.error(f"Error in veteran_role_check: {e}")
@@ -79,34 +134,46 @@ class RoleManager(commands.Cog):
             veteran_count = 0
             checked_count = 0
 
-            # Check all members in the guild
-            async for member in guild.fetch_members(limit=None):
+            # Collect qualifying members first, then assign in small
+            # concurrent batches; discord.py's HTTP client already honors
+            # per-route rate limits, so the old fixed 1s sleep per member
+            # only serialized the round-trips.
+            # The members intent is enabled, so the gateway cache already
+            # holds the full member list — no need to page over HTTP
+            candidates = []
+            for member in guild.members:
                 if member.bot:  # Skip bots
                     continue
 
                 checked_count += 1
 
                 # Check if member qualifies for veteran role
-                if await self.is_discord_veteran(member):
-                    if veteran_role not in member.roles:
-                        try:
-                            await member.add_roles(
-                                veteran_role,
-                                reason="Automatic: Discord account > 5 years old"
-                            )
-                            veteran_count += 1
-                            self.logger.info(
-                                f"Assigned Discord Veteran role to {member} in {guild.name}")
-
-                            # Rate limiting: Small delay to avoid API limits
-                            await asyncio.sleep(1)
-
-                        except discord.Forbidden:
-                            self.logger.warning(
-                                f"No permission to assign role to {member} in {guild.name}")
-                        except discord.HTTPException as e:
-                            self.logger.error(
-                                f"Failed to assign role to {member}: {e}")
+                if await self.is_discord_veteran(member) and veteran_role not in member.roles:
+                    candidates.append(member)
+
+            for start in range(0, len(candidates), 5):
+                batch = candidates[start:start + 5]
+                # Single-role PUT via the low-level route: add_roles would
+                # rebuild and diff the member's full role list per call,
+                # which the sweep doesn't need for one known role
+                results = await asyncio.gather(
+                    *(self.bot.http.add_role(
+                        guild.id, member.id, veteran_role.id,
+                        reason="Automatic: Discord account > 5 years old"
+                    ) for member in batch),
+                    return_exceptions=True
+                )
+                for member, result in zip(batch, results):
+                    if isinstance(result, discord.Forbidden):
+                        self.logger.warning(
+                            f"No permission to assign role to {member} in {guild.name}")
+                    elif isinstance(result, Exception):
+                        self.logger.error(
+                            f"Failed to assign role to {member}: {result}")
+                    else:
+                        veteran_count += 1
+                        self.logger.info(
+                            f"Assigned Discord Veteran role to {member} in {guild.name}")
 
             self.logger.info(
                 f"Guild {guild.name}: Checked {checked_count} members, "
@@ -117,12 +184,27 @@ class RoleManager(commands.Cog):
             self.logger.error(
                 f"Error checking veteran roles in {guild.name}: {e}")
 
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        """Drop the cached role id if the veteran role gets deleted."""
+        if self._veteran_role_ids.get(role.guild.id) == role.id:
+            del self._veteran_role_ids[role.guild.id]
+
     async def get_or_create_veteran_role(self, guild: discord.Guild) -> Optional[discord.Role]:
         """Get existing Discord Veteran role or create it if it doesn't exist."""
         try:
+            # Fast path: resolve a previously seen role by id
+            role_id = self._veteran_role_ids.get(guild.id)
+            if role_id:
+                role = guild.get_role(role_id)
+                if role:
+                    return role
+                del self._veteran_role_ids[guild.id]
+
             # Check if role already exists
             for role in guild.roles:
                 if role.name == self.VETERAN_ROLE_NAME:
+                    self._veteran_role_ids[guild.id] = role.id
                     return role
 
             # Create the role if it doesn't exist
@@ -133,6 +215,7 @@ class RoleManager(commands.Cog):
                 mentionable=True
             )
 
+            self._veteran_role_ids[guild.id] = veteran_role.id
             self.logger.info(f"Created Discord Veteran role in {guild.name}")
             return veteran_role
 
@@ -144,14 +227,27 @@ class RoleManager(commands.Cog):
                 f"Failed to create Discord Veteran role in {guild.name}: {e}")
             return None
 
+    def _compute_veteran_cutoff(self) -> datetime:
+        """Latest creation date that still qualifies as a veteran account."""
+        return datetime.now(timezone.utc) - timedelta(
+            days=round(self.VETERAN_THRESHOLD_YEARS * 365.25))
+
     async def is_discord_veteran(self, member: discord.Member) -> bool:
         """Check if a member qualifies as a Discord veteran (5+ years)."""
         try:
-            # Calculate account age
-            account_age = datetime.utcnow() - member.created_at.replace(tzinfo=None)
-            years = account_age.days / 365.25
+            now = time.monotonic()
+            cached = self._veteran_cache.get(member.id)
+            if cached and now - cached[0] < self._veteran_cache_ttl:
+                return cached[1]
+
+            # Compare against a precomputed cutoff date; created_at is
+            # already timezone-aware, so this is a single comparison
+            if self._veteran_cutoff is None:
+                self._veteran_cutoff = self._compute_veteran_cutoff()
 
-            return years >= self.VETERAN_THRESHOLD_YEARS
+            is_veteran = member.created_at <= self._veteran_cutoff
+            self._veteran_cache[member.id] = (now, is_veteran)
+            return is_veteran
 
         except Exception as e:
             self.logger.error(
@@ -165,20 +261,32 @@ class RoleManager(commands.Cog):
             if member.bot:  # Skip bots
                 return
 
-            if await self.is_discord_veteran(member):
-                # Small delay to ensure member is fully loaded
-                await asyncio.sleep(2)
+            # Most joins are young accounts — bail out on a plain timestamp
+            # compare before touching the role cache or any Discord call
+            if self._veteran_cutoff is None:
+                self._veteran_cutoff = self._compute_veteran_cutoff()
+            if member.created_at > self._veteran_cutoff:
+                return
 
-                veteran_role = await self.get_or_create_veteran_role(member.guild)
-                if veteran_role:
+            # on_member_join fires after the member is cached, so assign
+            # immediately; one short retry covers the rare gateway race
+            # that the old fixed 2s sleep was guarding against
+            veteran_role = await self.get_or_create_veteran_role(member.guild)
+            if veteran_role:
+                try:
+                    await member.add_roles(veteran_role, reason="Automatic: New member is Discord veteran")
+                    self.logger.info(
+                        f"Assigned Discord Veteran role to new member {member}")
+                except discord.Forbidden:
+                    self.logger.warning(
+                        f"No permission to assign veteran role to new member {member}")
+                except discord.HTTPException as e:
                     try:
+                        await asyncio.sleep(0.5)
                         await member.add_roles(veteran_role, reason="Automatic: New member is Discord veteran")
                         self.logger.info(
-                            f"Assigned Discord Veteran role to new member {member}")
-                    except discord.Forbidden:
-                        self.logger.warning(
-                            f"No permission to assign veteran role to new member {member}")
-                    except discord.HTTPException as e:
+                            f"Assigned Discord Veteran role to new member {member} (retry)")
+                    except discord.HTTPException:
                         self.logger.error(
                             f"Failed to assign veteran role to new member {member}: {e}")
 
@@ -223,47 +331,65 @@ class RoleManager(commands.Cog):
             self.logger.error(f"Error in check_veterans_command: {e}")
             await interaction.followup.send("❌ An error occurred while checking veteran roles.")
 
-    @discord.app_commands.command(name="veteran_info", description="Show information about Discord Veteran role criteria")
-    async def veteran_info_command(self, interaction: discord.Interaction):
-        """Show information about the Discord Veteran role."""
+    @discord.app_commands.command(name="veteran_enable", description="[Admin] Enable or disable automatic Discord Veteran role checks")
+    @discord.app_commands.describe(enabled='Whether the daily veteran role check should run in this server')
+    async def veteran_enable_command(self, interaction: discord.Interaction, enabled: bool):
+        """Toggle the daily veteran role check for this guild."""
         try:
-            embed = discord.Embed(
-                title="🥇 Discord Veteran Role",
-                description="Automatic role for long-time Discord users",
-                color=discord.Color.gold()
-            )
+            if not interaction.guild:
+                await interaction.response.send_message(
+                    "❌ This command can only be used in a server.",
+                    ephemeral=True
+                )
+                return
 
-            embed.add_field(
-                name="📅 Qualification",
-                value=f"Discord account must be **{self.VETERAN_THRESHOLD_YEARS}+ years old**",
-                inline=False
-            )
+            if not await is_admin(interaction, self.bot):
+                await interaction.response.send_message(
+                    "❌ You need administrator permissions to use this command.",
+                    ephemeral=True
+                )
+                return
 
-            embed.add_field(
-                name="🤖 Assignment",
-                value="• Automatically assigned when joining the server\n• Daily checks for existing members\n• Manual check available for admins",
-                inline=False
-            )
+            await self.bot.db.set_veteran_check_enabled(interaction.guild.id, enabled)
 
-            embed.add_field(
-                name="🎨 Role Details",
-                value="• Color: Gold\n• Mentionable: Yes\n• Special recognition for Discord veterans",
-                inline=False
-            )
+            if enabled:
+                message = "✅ Daily Discord Veteran role checks are now **enabled** for this server."
+            else:
+                message = "✅ Daily Discord Veteran role checks are now **disabled** for this server."
+            await interaction.response.send_message(message, ephemeral=True)
+
+            self.logger.info(
+                f"Veteran role check {'enabled' if enabled else 'disabled'} "
+                f"for guild {interaction.guild.name}")
+
+        except Exception as e:
+            self.logger.error(f"Error in veteran_enable_command: {e}")
+            await safe_response(interaction, "❌ An error occurred while updating the setting.")
+
+    @discord.app_commands.command(name="veteran_info", description="Show information about Discord Veteran role criteria")
+    async def veteran_info_command(self, interaction: discord.Interaction):
+        """Show information about the Discord Veteran role."""
+        try:
+            # Copy the fields list so add_field below never mutates the
+            # shared template
+            data = dict(self._veteran_info_base)
+            data['fields'] = list(data['fields'])
+            embed = discord.Embed.from_dict(data)
 
             # Check if user qualifies (only if in a guild)
             if interaction.guild and isinstance(interaction.user, discord.Member):
+                # created_at is already tz-aware UTC, so subtract directly
+                # instead of stripping tzinfo from a naive utcnow()
+                account_age = datetime.now(
+                    timezone.utc) - interaction.user.created_at
+                years = account_age.days / 365.25
                 if await self.is_discord_veteran(interaction.user):
-                    account_age = datetime.utcnow() - interaction.user.created_at.replace(tzinfo=None)
-                    years = account_age.days / 365.25
                     embed.add_field(
                         name="✅ Your Status",
                         value=f"You qualify! Your account is **{years:.1f} years old**",
                         inline=False
                     )
                 else:
-                    account_age = datetime.utcnow() - interaction.user.created_at.replace(tzinfo=None)
-                    years = account_age.days / 365.25
                     years_needed = self.VETERAN_THRESHOLD_YEARS - years
                     embed.add_field(
                         name="⏳ Your Status",
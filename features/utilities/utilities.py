@@ -11,8 +11,149 @@ from utils.version import get_bot_name
 import discord
 from discord.ext import commands
 from discord import app_commands
+import asyncio
 import logging
+import mmap
 import os
+import re
+
+
+# The name is fixed for the process lifetime; reading version.json once at
+# import keeps it out of every command's string interpolation
+BOT_NAME = get_bot_name()
+
+
+# Compiled per-level line matchers, built lazily and reused across calls
+_LEVEL_PATTERNS: dict[str, re.Pattern] = {}
+
+
+def _count_lines(data: bytes) -> int:
+    """Count lines in a raw log slice without splitting it."""
+    if not data:
+        return 0
+    return data.count(b'\n') + (0 if data.endswith(b'\n') else 1)
+
+
+def _tail_bytes(path: str, n: int) -> bytes:
+    """Read only the last n lines of a file, seeking backwards in chunks.
+
+    Avoids loading a multi-MB log into memory just to slice off the tail;
+    the result stays raw bytes so later filters skip decoding too.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b''
+        while pos > 0 and data.count(b'\n') <= n:
+            read_size = min(65536, pos)
+            pos -= read_size
+            f.seek(pos)
+            data = f.read(read_size) + data
+
+    skip = _count_lines(data) - n
+    start = 0
+    for _ in range(max(0, skip)):
+        start = data.index(b'\n', start) + 1
+    return data[start:]
+
+
+def _lines_since(path: str, cutoff: datetime) -> Optional[bytes]:
+    """Return the raw log slice timestamped at or after cutoff, or None to
+    signal that the caller should fall back to a linear scan.
+
+    Log lines are written in timestamp order, so binary-search the byte
+    offsets for the first line >= cutoff instead of strptime-ing every
+    line in the file.
+    """
+    try:
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = mm.size()
+
+                def line_start(pos: int) -> int:
+                    return mm.rfind(b'\n', 0, pos) + 1
+
+                lo, hi = 0, size
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    start = line_start(mid)
+                    ts = datetime.strptime(
+                        mm[start:start + 19].decode('ascii'),
+                        '%Y-%m-%d %H:%M:%S')
+                    if ts >= cutoff:
+                        hi = start
+                    else:
+                        nl = mm.find(b'\n', start)
+                        lo = size if nl == -1 else nl + 1
+
+                if lo >= size:
+                    return b''
+                return mm[lo:]
+    except (ValueError, UnicodeDecodeError):
+        # A probed line didn't carry a parseable timestamp prefix
+        return None
+
+
+def _collect_logs(log_file: str, lines: int, hours: Optional[int],
+                  minutes: Optional[int],
+                  level: Optional[str]) -> tuple[bytes, int, str, bool]:
+    """Blocking read-and-filter for /logs, run in a worker thread.
+
+    Returns (log_bytes, line_count, time_desc, window_empty); window_empty
+    is True when the requested slice held no lines before level filtering.
+    """
+    time_desc = "recent entries"  # Default description
+
+    if minutes or hours:
+        cutoff_time = datetime.now()
+        if minutes:
+            cutoff_time -= timedelta(minutes=minutes)
+            time_desc = f"last {minutes} minute(s)"
+        elif hours:
+            cutoff_time -= timedelta(hours=hours)
+            time_desc = f"last {hours} hour(s)"
+
+        # Timestamps are monotonic, so binary search for the first line
+        # in the window rather than parsing every line
+        log_bytes = _lines_since(log_file, cutoff_time)
+        if log_bytes is None:
+            # Fallback: stream line by line so only the matching window
+            # is held in memory, never the whole file
+            filtered_lines = []
+            with open(log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        # Extract timestamp from log line (assuming format: YYYY-MM-DD HH:MM:SS,mmm)
+                        if len(line) > 19:
+                            timestamp_str = line[:19]
+                            log_time = datetime.strptime(
+                                timestamp_str, '%Y-%m-%d %H:%M:%S')
+                            if log_time >= cutoff_time:
+                                filtered_lines.append(line)
+                    except (ValueError, IndexError):
+                        # If we can't parse timestamp, include the line anyway
+                        filtered_lines.append(line)
+            log_bytes = ''.join(filtered_lines).encode('utf-8')
+    else:
+        # Read just the tail instead of the whole file
+        log_bytes = _tail_bytes(log_file, lines)
+        time_desc = f"most recent {_count_lines(log_bytes)} entries"
+
+    if not log_bytes:
+        return b'', 0, time_desc, True
+
+    # Filter by log level if specified — substring match on the raw
+    # bytes, so non-matching lines are never decoded
+    if level:
+        level_upper = level.upper()
+        pattern = _LEVEL_PATTERNS.get(level_upper)
+        if pattern is None:
+            pattern = _LEVEL_PATTERNS[level_upper] = re.compile(
+                rb'[^\n]* - ' + level_upper.encode('ascii') + rb' - [^\n]*\n?')
+        log_bytes = b''.join(
+            m.group(0) for m in pattern.finditer(log_bytes))
+
+    return log_bytes, _count_lines(log_bytes), time_desc, False
 
 
 async def log_level_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
@@ -29,6 +170,16 @@ class UtilityCommands(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+        # The help/hello/contribute embeds are static, so each is built on
+        # first use and reused for every later invocation
+        self._help_embed: Optional[discord.Embed] = None
+        self._admin_help_embed: Optional[discord.Embed] = None
+        self._hello_embed: Optional[discord.Embed] = None
+        self._contribute_embed: Optional[discord.Embed] = None
+
+        # Log path resolved by the first /logs call and reused afterwards
+        self._log_file_path: Optional[str] = None
+
     @app_commands.command(name="ping", description="Check bot response time")
     async def ping(self, interaction: discord.Interaction):
         """Check bot latency."""
@@ -42,57 +193,63 @@ class UtilityCommands(commands.Cog):
         )
         await interaction.response.send_message(embed=embed)
 
-    @app_commands.command(name="hello", description=f"Say hello to the {get_bot_name()}")
+    @app_commands.command(name="hello", description=f"Say hello to the {BOT_NAME}")
     async def hello(self, interaction: discord.Interaction):
         """Greet the user."""
-        embed = discord.Embed(
-            title="👋 Hello SST Batch '29!",
-            description=f"Hey {interaction.user.mention}! I'm the {get_bot_name()} here to help our batch!",
-            color=0x3498db
-        )
-        embed.add_field(
-            name="🎯 What I Do",
-            value="I help with contest notifications, server management, and batch coordination!",
-            inline=False
-        )
+        if self._hello_embed is None:
+            self._hello_embed = discord.Embed(
+                title="👋 Hello SST Batch '29!",
+                color=0x3498db
+            )
+            self._hello_embed.add_field(
+                name="🎯 What I Do",
+                value="I help with contest notifications, server management, and batch coordination!",
+                inline=False
+            )
+
+        # Only the mention varies per call; copy the template and fill it in
+        embed = self._hello_embed.copy()
+        embed.description = f"Hey {interaction.user.mention}! I'm the {BOT_NAME} here to help our batch!"
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="help", description="Show all available commands")
     async def help(self, interaction: discord.Interaction):
         """Show interactive bot help with command categories."""
-        embed = discord.Embed(
-            title="🤖 SST Lounge Bot - Interactive Command Guide",
-            description=f"**{get_bot_name()} for SST Batch '29**\n\n"
-            "Welcome! Use the buttons below to explore different command categories.\n"
-            "Each button shows detailed information about specific features.",
-            color=0x3498db
-        )
+        if self._help_embed is None:
+            embed = discord.Embed(
+                title="🤖 SST Lounge Bot - Interactive Command Guide",
+                description=f"**{BOT_NAME} for SST Batch '29**\n\n"
+                "Welcome! Use the buttons below to explore different command categories.\n"
+                "Each button shows detailed information about specific features.",
+                color=0x3498db
+            )
 
-        embed.add_field(
-            name="� Quick Overview",
-            value="🏆 **Contest Commands** - Track programming contests across platforms\n"
-                  "🛠️ **Utility Commands** - Basic bot functionality and information\n"
-                  "🎭 **Role Management** - Discord Veteran role system\n"
-                  "⚙️ **Admin Commands** - Administrative controls (admin only)",
-            inline=False
-        )
+            embed.add_field(
+                name="� Quick Overview",
+                value="🏆 **Contest Commands** - Track programming contests across platforms\n"
+                      "🛠️ **Utility Commands** - Basic bot functionality and information\n"
+                      "🎭 **Role Management** - Discord Veteran role system\n"
+                      "⚙️ **Admin Commands** - Administrative controls (admin only)",
+                inline=False
+            )
 
-        embed.add_field(
-            name="💡 Getting Started",
-            value="• Click any button below for detailed command information\n"
-                  "• All times are displayed in **IST** timezone\n"
-                  "• Use `/contribute` to help improve the bot or report bugs or suggest features\n"
-                  "• Mention the bot directly for a quick feature overview",
-            inline=False
-        )
+            embed.add_field(
+                name="💡 Getting Started",
+                value="• Click any button below for detailed command information\n"
+                      "• All times are displayed in **IST** timezone\n"
+                      "• Use `/contribute` to help improve the bot or report bugs or suggest features\n"
+                      "• Mention the bot directly for a quick feature overview",
+                inline=False
+            )
 
-        embed.set_footer(
-            text=f"{get_bot_name()} | Made for SST Batch '29 | Use buttons for detailed help"
-        )
+            embed.set_footer(
+                text=f"{BOT_NAME} | Made for SST Batch '29 | Use buttons for detailed help"
+            )
+            self._help_embed = embed
 
         # Create interactive view with buttons
         view = HelpView(self.bot)
-        await interaction.response.send_message(embed=embed, view=view)
+        await interaction.response.send_message(embed=self._help_embed, view=view)
 
     @app_commands.command(name="admin_help", description="Show admin commands (Admin only)")
     async def admin_help(self, interaction: discord.Interaction):
@@ -101,38 +258,40 @@ class UtilityCommands(commands.Cog):
             await interaction.response.send_message("❌ You need admin permissions to use this command.", ephemeral=True)
             return
 
-        embed = discord.Embed(
-            title=f"⚙️ {get_bot_name()} - Interactive Admin Guide",
-            description="**Administrative Control Panel for SST Batch '29**\n\n"
-            "Use the buttons below to explore different admin command categories.\n"
-            "Each section provides detailed information about specific administrative features.",
-            color=0xe74c3c
-        )
+        if self._admin_help_embed is None:
+            embed = discord.Embed(
+                title=f"⚙️ {BOT_NAME} - Interactive Admin Guide",
+                description="**Administrative Control Panel for SST Batch '29**\n\n"
+                "Use the buttons below to explore different admin command categories.\n"
+                "Each section provides detailed information about specific administrative features.",
+                color=0xe74c3c
+            )
 
-        embed.add_field(
-            name="🔧 Admin Categories",
-            value="🤖 **Bot Management** - System monitoring and control\n"
-                  "🏆 **Contest Settings** - Configure announcements and data\n"
-                  "👑 **Owner Commands** - Privilege management (owner only)",
-            inline=False
-        )
+            embed.add_field(
+                name="🔧 Admin Categories",
+                value="🤖 **Bot Management** - System monitoring and control\n"
+                      "🏆 **Contest Settings** - Configure announcements and data\n"
+                      "👑 **Owner Commands** - Privilege management (owner only)",
+                inline=False
+            )
 
-        embed.add_field(
-            name="⚡ Quick Access",
-            value="• **`/info`** - Bot statistics and performance\n"
-                  "• **`/logs`** - Export bot logs for troubleshooting\n"
-                  "• **`/list_admins`** - View all current administrators\n"
-                  "• **`/sync`** - Refresh slash commands with Discord",
-            inline=False
-        )
+            embed.add_field(
+                name="⚡ Quick Access",
+                value="• **`/info`** - Bot statistics and performance\n"
+                      "• **`/logs`** - Export bot logs for troubleshooting\n"
+                      "• **`/list_admins`** - View all current administrators\n"
+                      "• **`/sync`** - Refresh slash commands with Discord",
+                inline=False
+            )
 
-        embed.set_footer(
-            text=f"{get_bot_name()} Admin Panel | Use buttons for detailed command information"
-        )
+            embed.set_footer(
+                text=f"{BOT_NAME} Admin Panel | Use buttons for detailed command information"
+            )
+            self._admin_help_embed = embed
 
         # Create interactive admin view with buttons
         view = AdminHelpView(self.bot)
-        await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+        await interaction.response.send_message(embed=self._admin_help_embed, view=view, ephemeral=True)
 
     @app_commands.command(name="logs", description="Export bot logs as file (Admin only)")
     @app_commands.describe(
@@ -172,96 +331,64 @@ class UtilityCommands(commands.Cog):
                 await interaction.followup.send("❌ Level must be one of: INFO, WARNING, ERROR, DEBUG", ephemeral=True)
                 return
 
-            # Find log file
-            log_file = None
-            possible_paths = [
-                'features/logs/sst_lounge.log',
-                'logs/sst_lounge.log',
-                'sst_lounge.log',
-                'bot.log',
-                'logs/bot.log'
-            ]
-
-            for path in possible_paths:
-                if os.path.exists(path):
-                    log_file = path
-                    break
+            # Find log file, preferring the path resolved on a previous
+            # call so the candidate probing runs at most once
+            log_file = self._log_file_path
+            if log_file is None or not os.path.exists(log_file):
+                log_file = None
+                possible_paths = [
+                    'features/logs/sst_lounge.log',
+                    'logs/sst_lounge.log',
+                    'sst_lounge.log',
+                    'bot.log',
+                    'logs/bot.log'
+                ]
+
+                for path in possible_paths:
+                    if os.path.exists(path):
+                        log_file = path
+                        break
+                self._log_file_path = log_file
 
             if not log_file:
                 await interaction.followup.send("❌ Log file not found. Check bot configuration.", ephemeral=True)
                 return
 
-            # Read log file
-            with open(log_file, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-
-            if not all_lines:
+            if os.path.getsize(log_file) == 0:
                 await interaction.followup.send("📝 Log file is empty.", ephemeral=True)
                 return
 
-            # Filter by time if specified
-            filtered_lines = []
-            time_desc = "recent entries"  # Default description
-
-            if minutes or hours:
-                cutoff_time = datetime.now()
-                if minutes:
-                    cutoff_time -= timedelta(minutes=minutes)
-                    time_desc = f"last {minutes} minute(s)"
-                elif hours:
-                    cutoff_time -= timedelta(hours=hours)
-                    time_desc = f"last {hours} hour(s)"
-
-                for line in all_lines:
-                    try:
-                        # Extract timestamp from log line (assuming format: YYYY-MM-DD HH:MM:SS,mmm)
-                        if len(line) > 19:
-                            timestamp_str = line[:19]
-                            log_time = datetime.strptime(
-                                timestamp_str, '%Y-%m-%d %H:%M:%S')
-                            if log_time >= cutoff_time:
-                                filtered_lines.append(line)
-                    except (ValueError, IndexError):
-                        # If we can't parse timestamp, include the line anyway
-                        filtered_lines.append(line)
+            # Read and filter off the event loop — a multi-MB log read
+            # would otherwise stall the gateway heartbeat and every other
+            # command for its duration
+            log_bytes, line_count, time_desc, window_empty = await asyncio.to_thread(
+                _collect_logs, log_file, lines or 50, hours, minutes, level)
 
-                log_lines = filtered_lines
-                if not log_lines:
-                    await interaction.followup.send(f"📝 No logs found in the {time_desc}.", ephemeral=True)
-                    return
-            else:
-                # Use last N lines
-                lines = lines or 50  # Ensure lines is not None
-                log_lines = all_lines[-lines:] if len(
-                    all_lines) > lines else all_lines
-                time_desc = f"most recent {len(log_lines)} entries"
-
-            # Filter by log level if specified
-            if level:
-                level_upper = level.upper()
-                log_lines = [
-                    line for line in log_lines if f" - {level_upper} - " in line]
-                if not log_lines:
-                    await interaction.followup.send(f"📝 No {level_upper} logs found in the {time_desc}.", ephemeral=True)
-                    return
-
-            # Prepare log content
-            log_content = ''.join(log_lines)
-
-            # Create file content with header
-            file_content = "=== Bot Logs Export ===\n"
-            file_content += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-            file_content += f"Time Range: {time_desc}\n"
-            if level:
-                file_content += f"Log Level: {level.upper()}\n"
-            file_content += f"Total Lines: {len(log_lines)}\n"
-            file_content += f"Source File: {log_file}\n"
-            file_content += "=" * 50 + "\n\n"
-            file_content += log_content
+            if window_empty:
+                await interaction.followup.send(f"📝 No logs found in the {time_desc}.", ephemeral=True)
+                return
+            if not log_bytes:
+                await interaction.followup.send(f"📝 No {level.upper()} logs found in the {time_desc}.", ephemeral=True)
+                return
+
+            # Assemble the export directly in bytes — the log slice is
+            # already bytes, so only the small header needs encoding and
+            # the body is never copied through a str
+            header = (
+                "=== Bot Logs Export ===\n"
+                f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"Time Range: {time_desc}\n"
+                + (f"Log Level: {level.upper()}\n" if level else "")
+                + f"Total Lines: {line_count}\n"
+                f"Source File: {log_file}\n"
+                + "=" * 50 + "\n\n"
+            )
 
-            # Create a file-like object
             import io
-            file_buffer = io.BytesIO(file_content.encode('utf-8'))
+            file_buffer = io.BytesIO()
+            file_buffer.write(header.encode('utf-8'))
+            file_buffer.write(log_bytes)
+            file_buffer.seek(0)
 
             # Generate filename with timestamp and filters
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -281,7 +408,7 @@ class UtilityCommands(commands.Cog):
             await interaction.followup.send(
                 content=f"� **Bot Logs Export**\n"
                 f"🕒 **Time Range:** {time_desc}\n"
-                f"📊 **Total Lines:** {len(log_lines)}\n"
+                f"📊 **Total Lines:** {line_count}\n"
                 f"📁 **File:** `{filename}`" +
                 (f"\n🔍 **Level Filter:** {level.upper()}" if level else ""),
                 file=discord_file,
@@ -289,6 +416,8 @@ class UtilityCommands(commands.Cog):
             )
 
         except FileNotFoundError:
+            # The cached path went away (e.g. rotation); re-probe next call
+            self._log_file_path = None
             await interaction.followup.send("❌ Log file not found.", ephemeral=True)
         except PermissionError:
             await interaction.followup.send("❌ Permission denied reading log file.", ephemeral=True)
@@ -299,6 +428,10 @@ class UtilityCommands(commands.Cog):
     @app_commands.command(name="contribute", description="Get information about contributing to the bot")
     async def contribute(self, interaction: discord.Interaction):
         """Show contribution information and GitHub repository link."""
+        if self._contribute_embed is not None:
+            await interaction.response.send_message(embed=self._contribute_embed)
+            return
+
         embed = discord.Embed(
             title="🤝 Contribute to SST Lounge Bot",
             description="**Help make the bot better for our SST Batch '29 community!**\n\n## 🎯 Your contributions matter",
@@ -372,6 +505,7 @@ class UtilityCommands(commands.Cog):
             text="Made by SST Batch '29 • For SST Batch '29 • Open Source ❤️ |"
         )
 
+        self._contribute_embed = embed
         await interaction.response.send_message(embed=embed)
 
 